@@ -0,0 +1,51 @@
+"""Options and fixtures of the pytest-benchmark suites."""
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+
+import pytest
+
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS.parent))
+sys.path.insert(0, str(BENCHMARKS))
+
+
+def pytest_addoption(parser):
+    """Add the option to benchmark on a recording of real traffic."""
+    parser.addoption(
+        "--replay",
+        type=Path,
+        default=None,
+        help="recording made with the 'Record raw API responses' option",
+    )
+
+
+@pytest.fixture
+def replay(request) -> Path:
+    """Return the recording given with --replay, skip without one."""
+    path = request.config.getoption("--replay")
+    if path is None:
+        pytest.skip("no recording given with --replay")
+    return path
+
+
+@pytest.fixture
+def loop_hass():
+    """Return an event loop and a Home Assistant instance running on it.
+
+    pytest-benchmark calls synchronous functions, so coroutines are run to
+    completion on this loop for every call.
+    """
+    from homeassistant.core import HomeAssistant
+
+    async def create(config_dir):
+        return HomeAssistant(config_dir)
+
+    loop = asyncio.new_event_loop()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = loop.run_until_complete(create(config_dir))
+        yield loop, hass
+        loop.run_until_complete(hass.async_stop(force=True))
+    loop.close()
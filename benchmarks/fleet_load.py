@@ -0,0 +1,215 @@
+"""Load test of one Home Assistant instance polling a fleet of chargers.
+
+Starts N simulated chargers in-process and sets up one config entry per
+charger, so that N real coordinators poll them through the shared scheduler
+and update the actual entity platforms. While the fleet runs, the event loop
+lag is sampled. Every fleet size reports loop lag percentiles, requests per
+second, CPU time per poll cycle and memory per charger; sweeping the size
+gives the scaling curve.
+
+Needs Home Assistant and pytest-homeassistant-custom-component, which
+provides the in-process test instance. Run from the repository root:
+
+    python benchmarks/fleet_load.py --chargers 1 10 50 100 250 500 \\
+        --scan-interval 15 --duration 60 --json fleet.json
+
+The simulated chargers run in the same process, so CPU time includes the
+simulator side of every request.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.config_entries import ConfigEntryState  # noqa: E402
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_SCAN_INTERVAL  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from custom_components.solax_http.const import (  # noqa: E402
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SN,
+    DOMAIN,
+)
+from simulator import Faults, start_fleet  # noqa: E402
+
+LAG_PROBE_INTERVAL = 0.05  # seconds between event loop lag samples
+
+
+class LoopLagMonitor:
+    """Sample how late the event loop runs a timer."""
+
+    def __init__(self, interval: float = LAG_PROBE_INTERVAL) -> None:
+        """Initialize the monitor, start() begins sampling."""
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+
+    def percentiles(self) -> dict:
+        """Return lag percentiles in milliseconds."""
+        if len(self.samples) < 2:
+            return {}
+        cuts = statistics.quantiles(self.samples, n=100)
+        return {
+            "p50_ms": cuts[49] * 1000,
+            "p95_ms": cuts[94] * 1000,
+            "p99_ms": cuts[98] * 1000,
+            "max_ms": max(self.samples) * 1000,
+        }
+
+
+def _options(server, number: int, scan_interval: int) -> dict:
+    # The adaptive interval is pinned so every charger polls at scan_interval
+    return {
+        CONF_NAME: f"Charger {number}",
+        CONF_HOST: server.address,
+        CONF_SN: server.charger.pwd,
+        CONF_SCAN_INTERVAL: scan_interval,
+        CONF_MIN_SCAN_INTERVAL: scan_interval,
+        CONF_MAX_SCAN_INTERVAL: scan_interval,
+    }
+
+
+async def run_fleet(
+    chargers: int, scan_interval: int, duration: float, faults: Faults, generation
+) -> dict:
+    """Set up a fleet of chargers, let it poll and return the measurements."""
+    servers = await start_fleet(chargers, generation, faults)
+    try:
+        async with async_test_home_assistant() as hass:
+            # The test instance disables custom integrations by default
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+            tracemalloc.start()
+            entries = []
+            setup_start = time.perf_counter()
+            for number, server in enumerate(servers):
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    title=f"Charger {number}",
+                    options=_options(server, number, scan_interval),
+                )
+                entry.add_to_hass(hass)
+                entries.append(entry)
+                await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            setup_time = time.perf_counter() - setup_start
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            loaded = sum(entry.state is ConfigEntryState.LOADED for entry in entries)
+            requests_start = sum(server.stats["requests"] for server in servers)
+            monitor = LoopLagMonitor()
+            monitor.start()
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            await asyncio.sleep(duration)
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            await monitor.stop()
+            requests = sum(server.stats["requests"] for server in servers)
+            requests -= requests_start
+            failed = sum(
+                server.stats["failed"] + server.stats["lost"] for server in servers
+            )
+
+            for entry in entries:
+                await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+    finally:
+        for server in servers:
+            await server.stop()
+
+    cycles = wall / scan_interval
+    return {
+        "chargers": chargers,
+        "loaded": loaded,
+        "scan_interval": scan_interval,
+        "duration_s": wall,
+        "setup_s": setup_time,
+        "loop_lag": monitor.percentiles(),
+        "requests_per_s": requests / wall,
+        "failed_requests": failed,
+        "cpu_ms_per_cycle": cpu / cycles * 1000,
+        "cpu_load": cpu / wall,
+        "memory_kib_per_charger": memory / chargers / 1024,
+    }
+
+
+def _print(result: dict) -> None:
+    lag = result["loop_lag"]
+    print(
+        f"{result['chargers']:>5} chargers ({result['loaded']} loaded): "
+        f"lag p50 {lag.get('p50_ms', 0):6.2f} p95 {lag.get('p95_ms', 0):6.2f} "
+        f"p99 {lag.get('p99_ms', 0):6.2f} max {lag.get('max_ms', 0):7.2f} ms, "
+        f"{result['requests_per_s']:7.1f} req/s, "
+        f"CPU {result['cpu_ms_per_cycle']:8.1f} ms/cycle "
+        f"({result['cpu_load']:5.1%}), "
+        f"{result['memory_kib_per_charger']:7.1f} KiB/charger"
+    )
+
+
+async def _sweep(args) -> list[dict]:
+    faults = Faults(latency=args.latency, jitter=args.jitter, loss=args.loss)
+    results = []
+    for chargers in args.chargers:
+        result = await run_fleet(
+            chargers, args.scan_interval, args.duration, faults, args.generation
+        )
+        _print(result)
+        results.append(result)
+    return results
+
+
+def main():
+    """Run the load test for every fleet size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--chargers", type=int, nargs="+", default=[1, 10, 50, 100, 250, 500]
+    )
+    parser.add_argument("--scan-interval", type=int, default=15)
+    parser.add_argument("--duration", type=float, default=60, help="seconds per size")
+    parser.add_argument("--generation", choices=["G1", "G2", "mixed"], default="mixed")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--json", type=Path, help="write the scaling curve")
+    args = parser.parse_args()
+
+    results = asyncio.run(_sweep(args))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+"""Local stand-in for the HTTP API of SolaX EV chargers.
+
+Serves ``optType=ReadRealTimeData``, ``ReadSetData`` and ``setReg`` like the
+web server embedded in the chargers, so that the integration can be tested
+and benchmarked without hardware. The serial number selects the behaviour:
+``C...`` is a G1 charger, ``50...`` a G2 (HEC) charger.
+
+The G2 arrays are seeded from doc/ModeSet_test.txt, which was captured on a
+G2 charger. No G1 capture is available, so the G1 arrays are sized to cover
+the G1 register map and filled with plausible values.
+
+Faults can be injected to measure retry, timeout and throughput behaviour
+reproducibly: latency with jitter, lost requests (never answered), "failed"
+responses, bodies trickled out in small chunks and chargers which close the
+connection after every request. Run from the repository root:
+
+    python benchmarks/simulator.py --count 3 --latency 0.2 --loss 0.05
+
+and point the integration to 127.0.0.1:8000, 127.0.0.1:8001, ... using the
+printed serial numbers as password. The module is importable, see
+start_fleet() for running simulated chargers in-process.
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import random
+import time
+from urllib.parse import parse_qsl
+
+from aiohttp import web
+
+MODESET_TEST = Path(__file__).resolve().parent.parent / "doc" / "ModeSet_test.txt"
+
+STATE_AVAILABLE = 0
+STATE_PREPARING = 1  # vehicle plugged in, not charging
+STATE_CHARGING = 2
+STATE_FINISHING = 3
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Indices of the simulated values in the API arrays of a generation."""
+
+    set_length: int
+    data_length: int
+    mode: int  # Set index of the charging mode
+    data_mode: int  # Data index mirroring the mode
+    state: int  # Data index of the run state
+    voltage: tuple  # Data indices L1..L3, 0.01 V
+    current: tuple  # Data indices L1..L3, 0.01 A
+    power: tuple  # Data indices L1..L3, W
+    total_power: int
+    session_energy: int  # 0.1 kWh
+    total_energy: tuple  # (hi, lo) 0.1 kWh
+    charge_time: tuple  # (hi, lo) s
+    max_current: int  # Set index, A
+    set_regs: dict = field(default_factory=dict)  # setReg index -> (array, index)
+
+
+G1_LAYOUT = Layout(
+    set_length=100,
+    data_length=90,
+    mode=1,
+    data_mode=1,
+    state=26,
+    voltage=(2, 3, 4),
+    current=(5, 6, 7),
+    power=(8, 9, 10),
+    total_power=11,
+    session_energy=12,
+    total_energy=(15, 14),
+    charge_time=(81, 80),
+    max_current=76,
+    set_regs={
+        1: ("Set", 0),
+        2: ("Set", 1),
+        3: ("Set", 2),
+        4: ("Set", 3),
+        5: ("Set", 4),
+        11: ("Set", 11),
+        12: ("Set", 12),
+        13: ("Set", 13),
+        14: ("Set", 14),
+        15: ("Set", 15),
+        22: None,  # reset, write only
+        70: ("Data", 65),
+        82: ("Set", 76),
+        103: ("Set", 96),
+    },
+)
+
+G2_LAYOUT = Layout(
+    set_length=86,
+    data_length=106,
+    mode=1,
+    data_mode=2,
+    state=0,
+    voltage=(3, 4, 5),
+    current=(6, 7, 8),
+    power=(9, 10, 11),
+    total_power=12,
+    session_energy=13,
+    total_energy=(16, 15),
+    charge_time=(50, 49),
+    max_current=3,
+    set_regs={
+        52: ("Set", 1),
+        54: ("Set", 3),
+        62: ("Set", 11),
+        63: ("Set", 12),
+        132: ("Set", 81),
+    },
+)
+
+
+def _load_modeset_test():
+    """Return the first Set and Data arrays and the Information of the capture.
+
+    Some Data lines of the capture continue with the rest of the
+    ReadRealTimeData object, only the leading array is used.
+    """
+    set_data = data = None
+    info = list(G2_INFORMATION)
+    decoder = json.JSONDecoder()
+    for line in MODESET_TEST.read_text().splitlines():
+        line = line.strip()
+        if not line.startswith("["):
+            continue
+        values, end = decoder.raw_decode(line)
+        if len(values) == G2_LAYOUT.set_length and set_data is None:
+            set_data = values
+        elif len(values) == G2_LAYOUT.data_length and data is None:
+            data = values
+        if line[end:].startswith(',"Information":'):
+            info = decoder.raw_decode(line, end + len(',"Information":'))[0]
+    return set_data, data, info
+
+
+# Information of the capture, index 2 is the serial number, 4 the firmware
+G2_INFORMATION = [11.0, 3, "xxxxxxxx", 2, 2.03, 4.03, 0.0, 0.0, 0.0, 1, 1, 0, 73]
+
+
+def _g1_arrays():
+    set_data = [0] * G1_LAYOUT.set_length
+    set_data[2] = 70  # eco gear
+    set_data[3] = 16  # green gear
+    set_data[19] = 203  # firmware
+    set_data[76] = 16  # max charge current
+    data = [0] * G1_LAYOUT.data_length
+    data[0] = STATE_PREPARING
+    data[26] = STATE_PREPARING
+    data[2:5] = [23012, 22987, 23044]
+    data[24] = 31  # PCB temperature
+    data[33:36] = [4998, 4999, 4998]
+    data[65] = 3  # charge phase
+    return set_data, data, list(G2_INFORMATION)
+
+
+@dataclass
+class Faults:
+    """Faults injected into the responses of a simulated charger."""
+
+    latency: float = 0.0  # seconds before a response is started
+    jitter: float = 0.0  # +/- seconds added to the latency
+    loss: float = 0.0  # probability a request is never answered
+    loss_hold: float = 30.0  # seconds a lost request keeps the connection
+    failed: float = 0.0  # probability of a "failed" response
+    slow_body: float = 0.0  # probability the body is trickled out
+    slow_body_delay: float = 0.5  # seconds between body chunks
+    slow_body_chunk: int = 64  # bytes per body chunk
+    keep_alive: bool = True  # False closes the connection after each request
+
+
+class SimulatedCharger:
+    """State of one simulated charger."""
+
+    def __init__(self, sn: str, pwd: str = None, seed: int = 0) -> None:
+        """Initialize the charger arrays for the generation of the sn."""
+        if sn.startswith("C"):
+            self.generation = "G1"
+            self.layout = G1_LAYOUT
+            set_data, data, info = _g1_arrays()
+        elif sn.startswith("50"):
+            self.generation = "G2"
+            self.layout = G2_LAYOUT
+            set_data, data, info = _load_modeset_test()
+        else:
+            raise ValueError(f"Serial number {sn} is neither G1 (C...) nor G2 (50...)")
+        self.sn = sn
+        self.pwd = pwd or sn
+        self.set_data = list(set_data)
+        self.data = list(data)
+        self.info = info
+        self.info[2] = sn
+        self.firmware = info[4]
+        self._random = random.Random(seed)
+        self._last_tick = time.monotonic()
+        self._session_energy = 0.0  # kWh
+        self._charge_time = 0.0  # s
+        self.requests = 0
+        self.writes = 0
+        self._update_state()
+
+    def _update_state(self) -> None:
+        layout = self.layout
+        mode = self.set_data[layout.mode]
+        state = self.data[layout.state]
+        if mode and state in (STATE_PREPARING, STATE_FINISHING):
+            state = STATE_CHARGING
+        elif not mode and state == STATE_CHARGING:
+            state = STATE_FINISHING
+        self.data[layout.state] = state
+        self.data[layout.data_mode] = mode
+
+    def tick(self) -> None:
+        """Advance the measurements by the time since the last tick."""
+        now = time.monotonic()
+        elapsed, self._last_tick = now - self._last_tick, now
+        layout = self.layout
+        rnd = self._random
+        data = self.data
+        for idx in layout.voltage:
+            data[idx] = 23000 + rnd.randrange(-150, 150)
+        charging = data[layout.state] == STATE_CHARGING
+        amps = self.set_data[layout.max_current] if charging else 0.0
+        total = 0
+        for v_idx, i_idx, p_idx in zip(layout.voltage, layout.current, layout.power):
+            current = max(amps - rnd.random() * 0.2, 0.0) if amps else 0.0
+            data[i_idx] = int(current * 100)
+            data[p_idx] = int(data[v_idx] / 100 * current)
+            total += data[p_idx]
+        data[layout.total_power] = total
+        if charging:
+            self._session_energy += total * elapsed / 3600000
+            self._charge_time += elapsed
+        data[layout.session_energy] = int(self._session_energy * 10)
+        hi, lo = layout.total_energy
+        energy = (data[hi] << 16) + data[lo] + int(total * elapsed / 360000)
+        data[hi], data[lo] = energy >> 16, energy & 0xFFFF
+        hi, lo = layout.charge_time
+        data[hi], data[lo] = int(self._charge_time) >> 16, int(self._charge_time) & 0xFFFF
+
+    def read_realtime(self) -> dict:
+        """Return the ReadRealTimeData payload."""
+        self.tick()
+        return {
+            "sn": self.sn,
+            "ver": f"{self.firmware}",
+            "type": 1 if self.generation == "G1" else 2,
+            "Data": self.data,
+            "Information": self.info,
+            "OCPPServer": "",
+            "OCPPChargerId": "",
+            "QRContent": "",
+        }
+
+    def read_set(self) -> list:
+        """Return the ReadSetData payload."""
+        return self.set_data
+
+    def set_reg(self, request: dict) -> bool:
+        """Apply a setReg request, return False if it is malformed."""
+        entries = request.get("Data", [])
+        if request.get("num") != len(entries):
+            return False
+        for entry in entries:
+            if entry.get("reg") not in self.layout.set_regs:
+                return False
+        for entry in entries:
+            target = self.layout.set_regs[entry["reg"]]
+            if target is None:
+                continue  # write only, e.g. reset
+            source, index = target
+            array = self.set_data if source == "Set" else self.data
+            array[index] = int(float(entry["val"]))
+        self.writes += 1
+        self._update_state()
+        return True
+
+
+class SimulatorServer:
+    """aiohttp server answering the HTTP API of one simulated charger."""
+
+    def __init__(
+        self, charger: SimulatedCharger, faults: Faults = None, seed: int = 0
+    ) -> None:
+        """Initialize the server, start() binds it."""
+        self.charger = charger
+        self.faults = faults or Faults()
+        self._random = random.Random(seed)
+        self._runner = None
+        self.address = None
+        self.stats = {"requests": 0, "lost": 0, "failed": 0, "slow": 0}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, return host:port (port 0 picks a free port)."""
+        app = web.Application()
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self.address = f"{bound_host}:{bound_port}"
+        return self.address
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        params = dict(parse_qsl(await request.text(), keep_blank_values=True))
+        faults = self.faults
+        rnd = self._random
+        self.stats["requests"] += 1
+        self.charger.requests += 1
+
+        delay = faults.latency + rnd.uniform(-faults.jitter, faults.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if rnd.random() < faults.loss:
+            self.stats["lost"] += 1
+            await asyncio.sleep(faults.loss_hold)
+            if request.transport is not None:
+                request.transport.close()
+            return web.Response()  # the connection is gone, never sent
+
+        body = self._dispatch(params)
+        if body is None or rnd.random() < faults.failed:
+            self.stats["failed"] += 1
+            body = "failed"
+
+        if rnd.random() < faults.slow_body:
+            self.stats["slow"] += 1
+            return await self._trickle(request, body.encode())
+        response = web.Response(text=body)
+        if not faults.keep_alive:
+            response.force_close()
+        return response
+
+    def _dispatch(self, params: dict) -> str | None:
+        charger = self.charger
+        if params.get("pwd") != charger.pwd:
+            return None
+        opt_type = params.get("optType")
+        if opt_type == "ReadRealTimeData":
+            return json.dumps(charger.read_realtime(), separators=(",", ":"))
+        if opt_type == "ReadSetData":
+            return json.dumps(charger.read_set(), separators=(",", ":"))
+        if opt_type == "setReg":
+            try:
+                ok = charger.set_reg(json.loads(params.get("data", "")))
+            except (ValueError, TypeError, AttributeError):
+                ok = False
+            return "Y" if ok else None
+        return None
+
+    async def _trickle(self, request: web.Request, body: bytes) -> web.StreamResponse:
+        faults = self.faults
+        response = web.StreamResponse()
+        response.content_type = "text/plain"
+        response.content_length = len(body)
+        if not faults.keep_alive:
+            response.force_close()
+        await response.prepare(request)
+        for start in range(0, len(body), faults.slow_body_chunk):
+            await response.write(body[start : start + faults.slow_body_chunk])
+            await asyncio.sleep(faults.slow_body_delay)
+        await response.write_eof()
+        return response
+
+
+def serial_number(generation: str, number: int) -> str:
+    """Return a serial number of a 22 kW three phase charger."""
+    if generation == "G1":
+        return f"C3221{number:09d}"
+    return f"5030M{number:09d}"
+
+
+async def start_fleet(
+    count: int,
+    generation: str = "G2",
+    faults: Faults = None,
+    host: str = "127.0.0.1",
+    base_port: int = 0,
+    seed: int = 0,
+) -> list[SimulatorServer]:
+    """Start count simulated chargers.
+
+    generation is "G1", "G2" or "mixed". With base_port 0 every charger
+    listens on a free port, see SimulatorServer.address.
+    """
+    servers = []
+    for number in range(count):
+        gen = generation if generation != "mixed" else ("G1", "G2")[number % 2]
+        charger = SimulatedCharger(serial_number(gen, number), seed=seed + number)
+        server = SimulatorServer(charger, faults, seed=seed + number)
+        await server.start(host, base_port + number if base_port else 0)
+        servers.append(server)
+    return servers
+
+
+async def _serve(args) -> None:
+    faults = Faults(
+        latency=args.latency,
+        jitter=args.jitter,
+        loss=args.loss,
+        loss_hold=args.loss_hold,
+        failed=args.failed,
+        slow_body=args.slow_body,
+        slow_body_delay=args.slow_body_delay,
+        keep_alive=not args.no_keep_alive,
+    )
+    servers = await start_fleet(
+        args.count, args.generation, faults, args.host, args.port, args.seed
+    )
+    for server in servers:
+        charger = server.charger
+        print(f"{server.address}  {charger.generation}  sn/pwd {charger.sn}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for server in servers:
+            await server.stop()
+
+
+def main():
+    """Run simulated chargers until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000, help="port of the first charger")
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--generation", choices=["G1", "G2", "mixed"], default="G2")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--loss-hold", type=float, default=30.0)
+    parser.add_argument("--failed", type=float, default=0.0)
+    parser.add_argument("--slow-body", type=float, default=0.0)
+    parser.add_argument("--slow-body-delay", type=float, default=0.5)
+    parser.add_argument("--no-keep-alive", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
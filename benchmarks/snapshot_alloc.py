@@ -0,0 +1,112 @@
+"""Memory and allocation benchmark of the coordinator snapshot containers.
+
+Compares the former per-poll ``dict(enumerate(...))`` snapshot with
+RegisterArray for a fleet of chargers. Run from the repository root:
+
+    python benchmarks/snapshot_alloc.py --chargers 50 --polls 200
+"""
+
+import argparse
+import importlib.util
+from pathlib import Path
+import random
+import time
+import tracemalloc
+
+SNAPSHOT_PY = (
+    Path(__file__).resolve().parent.parent
+    / "custom_components"
+    / "solax_http"
+    / "snapshot.py"
+)
+
+# G2 payloads taken from doc/ModeSet_test.txt
+SET = [0, 0, 70, 16, 0, 2, 0, 1, 0, 1, 0, 10, 6, 265, 160, 0, 0, 0, 0, 0, 0, 44, 25, 0, 0, 12593, 12593, 12593] + [0] * 17 + [600] + [0] * 25 + [4600, 0, 0, 0, 0, 0, 1, 257, 2, 0, 0, 0, 0, 220, 0]
+DATA = [2, 0, 1, 22704, 22408, 22843, 72, 0, 0, 0, 0, 0, 0, 0, 0, 1069, 0, 19, 19, 65518, 78, 30, 7, 417, 13, 20, 0, 2, 0, 0, 0, 0, 0, 4988, 4984, 4986, 13366, 6414, 6156, 3] + [0] * 8 + [1, 3, 0, 13363, 6414, 6156, 48, 565, 166, 0, 44, 0, 0, 1, 0, 100] + [0] * 30 + [1, 12, 50, 34, 0, 24, 0, 0]
+INFO = [11.000, 3, "xxxxxxxx", 2, 2.03, 4.03, 0.00, 0.00, 0.00, 1, 1, 0, 73]
+
+
+def _load_register_array():
+    # Loaded by path so that the benchmark runs without Home Assistant.
+    spec = importlib.util.spec_from_file_location("snapshot", SNAPSHOT_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.RegisterArray
+
+
+def _responses(chargers, polls):
+    """Yield freshly decoded JSON lists, as every poll gets new ones."""
+    rnd = random.Random(0)
+    for _ in range(polls):
+        for charger in range(chargers):
+            data = list(DATA)
+            data[3] = 22000 + rnd.randrange(1000)
+            yield charger, list(SET), data, list(INFO)
+
+
+def build_dicts(chargers, polls):
+    """Build snapshots the way the coordinator used to."""
+    fleet = [None] * chargers
+    for charger, set_data, data, info in _responses(chargers, polls):
+        fleet[charger] = {
+            "Set": dict(enumerate(set_data)),
+            "Data": dict(enumerate(data)),
+            "Info": dict(enumerate(info)),
+        }
+    return fleet
+
+
+def build_arrays(chargers, polls, register_array):
+    """Build snapshots with reused RegisterArray buffers."""
+    buffers = [
+        (register_array(), register_array(), register_array())
+        for _ in range(chargers)
+    ]
+    fleet = [None] * chargers
+    for charger, set_data, data, info in _responses(chargers, polls):
+        set_arr, data_arr, info_arr = buffers[charger]
+        fleet[charger] = {
+            "Set": set_arr.refill(set_data),
+            "Data": data_arr.refill(data),
+            "Info": info_arr.refill(info),
+        }
+    return fleet
+
+
+def measure(name, func, *args):
+    """Run func under tracemalloc and print retained/peak memory and time."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    fleet = func(*args)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    chargers = len(fleet)
+    print(
+        f"{name:>6}: retained {current / chargers / 1024:7.1f} KiB/charger, "
+        f"peak {peak / 1024:8.1f} KiB, {elapsed * 1000:8.1f} ms"
+    )
+    return current, peak, elapsed
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chargers", type=int, default=50)
+    parser.add_argument("--polls", type=int, default=200)
+    args = parser.parse_args()
+
+    register_array = _load_register_array()
+    print(f"{args.chargers} chargers x {args.polls} polls")
+    dicts = measure("dict", build_dicts, args.chargers, args.polls)
+    arrays = measure(
+        "array", build_arrays, args.chargers, args.polls, register_array
+    )
+    print(
+        f"retained memory ratio {arrays[0] / dicts[0]:.2f}, "
+        f"time ratio {arrays[2] / dicts[2]:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
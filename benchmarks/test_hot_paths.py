@@ -0,0 +1,300 @@
+"""Benchmarks of the decode and entity update hot paths.
+
+Covers decoding the responses, plugin.map_data over every entity
+description of a G1 and a G2 charger, _apply_scale/_reverse_scale with dict,
+numeric and callable scales, building the snapshot from recorded payloads and
+a full coordinator refresh fanning out to one listener per entity
+description. Response decoding is also timed the way it was done before
+decode_response (text, substring check, json.loads) for comparison.
+
+The payloads are recorded from the simulator, so no charger is needed.
+Needs Home Assistant and pytest-benchmark. Run from the repository root:
+
+    pytest benchmarks --benchmark-save=baseline
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:10%
+
+--replay adds refresh and decode benchmarks on real traffic, a recording
+made with the "Record raw API responses" option replayed as fast as
+possible:
+
+    pytest benchmarks --replay config/solax_http/<entry>.jsonl.gz
+
+Coroutines are run to completion with loop.run_until_complete for every
+call, so their timings include starting and stopping one loop run.
+"""
+
+import dataclasses
+import json
+import time
+import types
+
+import pytest
+
+from custom_components.solax_http.const import CONF_SN, DEFAULT_SCAN_INTERVAL
+from custom_components.solax_http.coordinator import SolaxHttpUpdateCoordinator
+from custom_components.solax_http.plugin_factory import PluginFactory
+from custom_components.solax_http.payload_capture import ReplayTransport
+from custom_components.solax_http.response import decode_response
+from custom_components.solax_http.snapshot import RegisterArray
+from simulator import SimulatedCharger, serial_number
+
+GENERATIONS = ("G1", "G2")
+
+
+class RecordedTransport:
+    """Transport answering from recorded responses, cycling through them."""
+
+    def __init__(self, realtime: list[str], set_data: str) -> None:
+        """Initialize the transport with the responses to replay."""
+        self._realtime = [text.encode() for text in realtime]
+        self._set_data = set_data.encode()
+        self._next = 0
+        self.stats = {}
+
+    async def async_post(self, payload: str, deadline: float = None):
+        """Return the recorded response for the request."""
+        if "ReadSetData" in payload:
+            return self._set_data
+        body = self._realtime[self._next]
+        self._next = (self._next + 1) % len(self._realtime)
+        return body
+
+    async def async_probe(self, timeout: float = None) -> bool:
+        """Recorded responses are always reachable."""
+        return True
+
+    async def async_close(self) -> None:
+        """Nothing to close."""
+
+
+def record(generation: str) -> tuple[list[str], str]:
+    """Record an idle and a charging realtime response and the Set response."""
+    charger = SimulatedCharger(serial_number(generation, 1))
+    realtime = [json.dumps(charger.read_realtime())]
+    set_reg = 52 if generation == "G2" else 2
+    charger.set_reg({"num": 1, "Data": [{"reg": set_reg, "val": "1"}]})
+    time.sleep(0.01)  # let the energy counters move
+    realtime.append(json.dumps(charger.read_realtime()))
+    return realtime, json.dumps(charger.read_set())
+
+
+@pytest.fixture(scope="module")
+def recordings() -> dict:
+    """Return the recorded responses per generation."""
+    return {generation: record(generation) for generation in GENERATIONS}
+
+
+def descriptions(plugin) -> list:
+    """Return the entity descriptions created for the plugin."""
+    return [
+        descr
+        for types_ in (
+            plugin.SENSOR_TYPES,
+            plugin.NUMBER_TYPES,
+            plugin.SELECT_TYPES,
+            plugin.TIME_TYPES,
+        )
+        for descr in types_
+        if plugin.matchWithMask(descr.allowedtypes, descr.blacklist)
+    ]
+
+
+def snapshot(realtime: str, set_data: str) -> dict:
+    """Build a snapshot the way the coordinator does."""
+    payload = json.loads(realtime)
+    return {
+        "Set": RegisterArray(json.loads(set_data)),
+        "Data": RegisterArray(payload["Data"]),
+        "Info": RegisterArray(payload["Information"]),
+    }
+
+
+def _decode_text(body: bytes, expected: type = dict):
+    """Decode a response the way the coordinator did before decode_response."""
+    text = body.decode()
+    if "failed" in text:
+        return None
+    return json.loads(text)
+
+
+DECODERS = {"decode_response": decode_response, "text": _decode_text}
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+@pytest.mark.parametrize("endpoint", ["realtime", "set"])
+@pytest.mark.parametrize("generation", GENERATIONS)
+def test_decode(benchmark, recordings, generation, endpoint, decoder):
+    """Decode a recorded response."""
+    realtime, set_data = recordings[generation]
+    if endpoint == "realtime":
+        body, expected = realtime[1].encode(), dict
+    else:
+        body, expected = set_data.encode(), list
+    benchmark(DECODERS[decoder], body, expected)
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+@pytest.mark.parametrize(
+    ("endpoint", "expected"), [("ReadRealTimeData", dict), ("ReadSetData", list)]
+)
+def test_decode_replay(benchmark, loop_hass, replay, endpoint, expected, decoder):
+    """Decode every response of a recording."""
+    loop, _ = loop_hass
+    transport = ReplayTransport(replay, speed=0)
+    loop.run_until_complete(transport.async_load())
+    bodies = [body.encode() for _, body in transport._all.get(endpoint, ())]
+    if not bodies:
+        pytest.skip(f"no {endpoint} responses in the recording")
+    decode = DECODERS[decoder]
+
+    def decode_all():
+        for body in bodies:
+            decode(body, expected)
+
+    benchmark(decode_all)
+
+
+@pytest.mark.parametrize("generation", GENERATIONS)
+def test_map_data(benchmark, recordings, generation):
+    """Decode the value of every entity description."""
+    realtime, set_data = recordings[generation]
+    plugin = PluginFactory.create_plugin(serial_number(generation, 1), "2.03")
+    descrs = descriptions(plugin)
+    data = snapshot(realtime[1], set_data)
+
+    def map_all():
+        for descr in descrs:
+            plugin.map_data(descr, data)
+
+    benchmark.extra_info["entities"] = len(descrs)
+    benchmark(map_all)
+
+
+@pytest.fixture(scope="module")
+def scaled_descriptions() -> dict:
+    """Return a G2 plugin with a dict, numeric and callable scaled description."""
+    plugin = PluginFactory.create_plugin(serial_number("G2", 1), "2.03")
+    descrs = descriptions(plugin)
+    dict_descr = next(
+        d for d in descrs if isinstance(getattr(d, "scale", None), dict)
+    )
+    numeric_descr = next(
+        d for d in descrs if isinstance(getattr(d, "scale", None), (int, float))
+    )
+    callable_descr = dataclasses.replace(
+        numeric_descr, scale=lambda value, descr: value * 0.1
+    )
+    dict_key = next(iter(dict_descr.scale))
+    return {
+        "plugin": plugin,
+        "dict": (dict_descr, dict_key, dict_descr.scale[dict_key]),
+        "numeric": (numeric_descr, 2301, 23.01),
+        "callable": (callable_descr, 2301, 23.01),
+    }
+
+
+@pytest.mark.parametrize("scale", ["dict", "numeric", "callable"])
+def test_apply_scale(benchmark, scaled_descriptions, scale):
+    """Scale a raw value."""
+    descr, raw, _ = scaled_descriptions[scale]
+    benchmark(scaled_descriptions["plugin"]._apply_scale, descr, raw)
+
+
+@pytest.mark.parametrize("scale", ["dict", "numeric", "callable"])
+def test_reverse_scale(benchmark, scaled_descriptions, scale):
+    """Turn a scaled value back into a raw one."""
+    descr, _, value = scaled_descriptions[scale]
+    benchmark(scaled_descriptions["plugin"]._reverse_scale, descr, value)
+
+
+def _coordinator(hass, name, sn, firmware, transport):
+    plugin = PluginFactory.create_plugin(sn, firmware)
+    entry = types.SimpleNamespace(
+        entry_id=f"benchmark_{name}",
+        data={},
+        options={CONF_SN: sn, "scan_interval": DEFAULT_SCAN_INTERVAL},
+        pref_disable_polling=True,
+    )
+    coordinator = SolaxHttpUpdateCoordinator(hass, entry, plugin, transport)
+    coordinator.config_entry = entry
+    # One listener per entity, doing what the entities do on update
+    descrs = descriptions(plugin)
+    for descr in descrs:
+        coordinator.async_add_listener(
+            lambda descr=descr: coordinator.get_data(descr), descr
+        )
+    return coordinator, len(descrs)
+
+
+@pytest.fixture(params=GENERATIONS)
+def coordinator(request, loop_hass, recordings):
+    """Return a coordinator polling recorded responses and its entity count."""
+    loop, hass = loop_hass
+    generation = request.param
+    coordinator, entities = _coordinator(
+        hass,
+        generation,
+        serial_number(generation, 1),
+        "2.03",
+        RecordedTransport(*recordings[generation]),
+    )
+    yield coordinator, entities
+    loop.run_until_complete(coordinator.async_shutdown())
+
+
+def test_snapshot_realtime(benchmark, loop_hass, coordinator):
+    """Read realtime data and build the snapshot."""
+    loop, _ = loop_hass
+    get_data = coordinator[0]._SolaxHttpUpdateCoordinator__async_get_data
+    benchmark(lambda: loop.run_until_complete(get_data()))
+
+
+def test_snapshot_full(benchmark, loop_hass, coordinator):
+    """Read realtime and Set data and build the snapshot."""
+    loop, _ = loop_hass
+    coordinator, _ = coordinator
+    get_data = coordinator._SolaxHttpUpdateCoordinator__async_get_data
+
+    def build_full():
+        coordinator.invalidate_set_data()
+        loop.run_until_complete(get_data())
+
+    benchmark(build_full)
+
+
+def test_refresh_fanout(benchmark, loop_hass, coordinator):
+    """Refresh and update one listener per entity description."""
+    loop, _ = loop_hass
+    coordinator, entities = coordinator
+    benchmark.extra_info["entities"] = entities
+    benchmark(lambda: loop.run_until_complete(coordinator.async_refresh()))
+    assert coordinator.last_update_success
+
+
+def test_refresh_replay(benchmark, loop_hass, replay):
+    """Refresh through every realtime response of a recording."""
+    loop, hass = loop_hass
+    transport = ReplayTransport(replay, speed=0)
+    loop.run_until_complete(transport.async_load())
+    first = json.loads(
+        loop.run_until_complete(transport.async_post("optType=ReadRealTimeData"))
+    )
+    info = first["Information"]
+    coordinator, entities = _coordinator(
+        hass, "replay", info[2], f"{info[4]}", transport
+    )
+    refreshes = len(transport._all.get("ReadRealTimeData", ()))
+
+    async def refresh_all():
+        for _ in range(refreshes):
+            await coordinator.async_refresh()
+
+    benchmark.extra_info["entities"] = entities
+    benchmark.extra_info["refreshes"] = refreshes
+    benchmark.pedantic(
+        lambda: loop.run_until_complete(refresh_all()),
+        setup=lambda: loop.run_until_complete(transport.async_load()),
+        rounds=3,
+    )
+    assert coordinator.last_update_success
+    loop.run_until_complete(coordinator.async_shutdown())
@@ -1,15 +1,27 @@
 """SolaX Http API Custom Component."""
 
+from functools import partial
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .const import ATTR_MANUFACTURER, CONF_SN, DOMAIN
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    ATTR_MANUFACTURER,
+    CONF_SN,
+    DATA_DEVICE,
+    DATA_SCHEDULER,
+    DOMAIN,
+    STORAGE_VERSION,
+)
 from .coordinator import SolaxHttpUpdateCoordinator
 from .plugin_factory import PluginFactory
+from .scheduler import SolaxHttpScheduler
+from .services import async_setup_services
+from .transport import SolaxHttpTransport
 
 PLATFORMS = ["button", "number", "select", "sensor", "time"]
 
@@ -21,6 +33,7 @@ async def async_setup(hass, config):
     """Set up the SolaX Http component."""
     hass.data[DOMAIN] = {}
     _LOGGER.debug("solax data %d", hass.data)
+    async_setup_services(hass)
     return True
 
 
@@ -32,7 +45,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     _LOGGER.debug("Setup %s.%s", DOMAIN, name)
 
-    plugin = await PluginFactory.get_plugin_instance(config[CONF_HOST], config[CONF_SN])
+    # All chargers are polled on one staggered timeline over a shared pool
+    hass.data.setdefault(DOMAIN, {})
+    scheduler = hass.data[DOMAIN].get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DOMAIN][DATA_SCHEDULER] = SolaxHttpScheduler(hass)
+
+    # One transport per charger, shared by detection and polling
+    transport = SolaxHttpTransport(config[CONF_HOST], pool=scheduler.pool)
+    entry.async_on_unload(transport.async_close)
+
+    # The detected identity is cached, so that setup does not need the
+    # charger to be online. Detection only runs for new or re-addressed chargers.
+    device = entry.data.get(DATA_DEVICE)
+    realtime_data = None
+    if device is not None and device["host"] == config[CONF_HOST]:
+        plugin = PluginFactory.create_plugin(
+            device["sn"], device["firmware"], device["invertertype"]
+        )
+    else:
+        plugin, realtime_data = await PluginFactory.get_plugin_instance(
+            transport, config[CONF_SN]
+        )
+        if plugin is None:
+            if scheduler.idle:
+                await scheduler.pool.async_close()
+            raise ConfigEntryNotReady(f"Unable to read {config[CONF_HOST]}")
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                DATA_DEVICE: {
+                    "host": config[CONF_HOST],
+                    "sn": plugin.serialnumber,
+                    "firmware": plugin.sw_version,
+                    "invertertype": plugin.invertertype,
+                },
+            },
+        )
     plugin.device_info = {
         "identifiers": {(DOMAIN, name, plugin.serialnumber)},
         "name": name,
@@ -42,17 +92,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         "hw_version": plugin.hw_version,
         "sw_version": plugin.sw_version,
     }
-    # Get the HA-managed aiohttp session
-    session = async_get_clientsession(hass)
-
-    coordinator = SolaxHttpUpdateCoordinator(hass, entry, plugin, session=session)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = SolaxHttpUpdateCoordinator(
+        hass, entry, plugin, transport, scheduler
+    )
+    scheduler.async_register(coordinator)
+    entry.async_on_unload(partial(scheduler.async_unregister, coordinator))
+    if realtime_data is not None:
+        # The detection already read realtime data, the first refresh reuses it
+        coordinator.seed_realtime_data(realtime_data)
+        await coordinator.async_config_entry_first_refresh()
+    else:
+        # Start with the last known values and refresh in the background
+        await coordinator.async_restore_snapshot()
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if realtime_data is None:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} {name} first refresh"
+        )
+
     entry.async_on_unload(entry.add_update_listener(config_entry_update_listener))
     return True
 
@@ -67,9 +128,16 @@ async def async_unload_entry(hass: HomeAssistant, entry):
     if not ok:
         return False
 
+    # Services must not reach the coordinator of an unloaded entry
+    hass.data[DOMAIN].pop(entry.entry_id, None)
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the snapshot persisted for a deleted entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def config_entry_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener, called when the config entry options are changed."""
     await hass.config_entries.async_reload(entry.entry_id)
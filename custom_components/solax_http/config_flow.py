@@ -19,10 +19,19 @@ from homeassistant.helpers.schema_config_entry_flow import (
 )
 
 from .const import (
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SET_SCAN_INTERVAL,
+    DEFAULT_WRITE_COMPARE_AGE,
     DOMAIN,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_PAYLOADS,
+    CONF_SET_SCAN_INTERVAL,
     CONF_SN,
+    CONF_WRITE_COMPARE_AGE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +46,9 @@ CONFIG_SCHEMA = vol.Schema(
             str, vol.Length(max=10, msg="invalid_sn_length")
         ),
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(
+            CONF_SET_SCAN_INTERVAL, default=DEFAULT_SET_SCAN_INTERVAL
+        ): int,
     }
 )
 
@@ -45,6 +57,19 @@ OPTION_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST): str,
         vol.Required(CONF_SN): vol.All(str, vol.Length(max=10)),
         vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+        vol.Optional(
+            CONF_SET_SCAN_INTERVAL, default=DEFAULT_SET_SCAN_INTERVAL
+        ): int,
+        vol.Optional(
+            CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL
+        ): int,
+        vol.Optional(
+            CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL
+        ): int,
+        vol.Optional(
+            CONF_WRITE_COMPARE_AGE, default=DEFAULT_WRITE_COMPARE_AGE
+        ): int,
+        vol.Optional(CONF_RECORD_PAYLOADS, default=False): bool,
     }
 )
 
@@ -60,11 +85,22 @@ async def _validate_host(handler: SchemaCommonFlowHandler, user_input: Any) -> A
     return user_input
 
 
+async def _validate_options(handler: SchemaCommonFlowHandler, user_input: Any) -> Any:
+    user_input = await _validate_host(handler, user_input)
+    scan_interval = user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    min_interval = user_input.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+    max_interval = user_input.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)
+    if not 0 < min_interval <= scan_interval <= max_interval:
+        _LOGGER.warning("Invalid scan intervals")
+        raise SchemaFlowError("invalid_scan_interval")
+    return user_input
+
+
 CONFIG_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
     "user": SchemaFlowFormStep(CONFIG_SCHEMA, validate_user_input=_validate_host),
 }
 OPTIONS_FLOW: dict[str, SchemaFlowFormStep | SchemaFlowMenuStep] = {
-    "init": SchemaFlowFormStep(OPTION_SCHEMA, validate_user_input=_validate_host),
+    "init": SchemaFlowFormStep(OPTION_SCHEMA, validate_user_input=_validate_options),
 }
 
 
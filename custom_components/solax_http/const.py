@@ -12,19 +12,69 @@ from homeassistant.components.time import TimeEntityDescription
 DOMAIN = "solax_http"
 
 ATTR_MANUFACTURER = "SolaX Power"
+ATTR_STALE = "stale"
+ATTR_DATA_TIME = "data_time"
 
 DEFAULT_NAME = "SolaX API"
 DEFAULT_SCAN_INTERVAL = 15
+DEFAULT_SET_SCAN_INTERVAL = 300
+DEFAULT_MIN_SCAN_INTERVAL = 5
+DEFAULT_MAX_SCAN_INTERVAL = 60
+DEFAULT_WRITE_COMPARE_AGE = 30
+FAST_POLL_AFTER_WRITE = 60  # seconds of fast polling after a setting change
 REQUEST_REFRESH_DELAY = 0.3
+WRITE_COALESCE_DELAY = 0.3  # seconds writes are queued before one setReg is sent
 API_TIMEOUT = 10
+CIRCUIT_BREAKER_THRESHOLD = 5  # consecutive failed polls before polling stops
+CIRCUIT_BREAKER_PROBE_INTERVAL = 300  # seconds between probes of a dead charger
+OFFLINE_PROBE_INTERVAL = 10  # seconds between probes of an unreachable charger
+OFFLINE_PROBE_TIMEOUT = 2  # seconds the reachability probe waits for an answer
+KEEPALIVE_TIMEOUT = 10  # seconds an idle connection to the charger is kept open
+MAX_CONCURRENT_REQUESTS = 4  # requests in flight over all chargers
+
+RECORDER_MAX_BYTES = 5 * 1024 * 1024  # size a recording is rotated at
+RECORDER_BACKUPS = 5  # rotated recordings kept
+RECORDER_FLUSH_DELAY = 60  # seconds recorded responses are batched for
+
+BURST_DEFAULT_INTERVAL = 1  # seconds between burst samples
+BURST_DEFAULT_DURATION = 300  # seconds a burst runs
+BURST_MIN_INTERVAL = 0.5
+BURST_MAX_INTERVAL = 60
+BURST_MAX_DURATION = 3600
+BURST_MAX_SAMPLES = 3600  # samples kept per charger
+
+STALE_DATA_TTL = 900  # seconds last good data is used after its endpoint failed
+
+REFRESH_BUDGET_SHARE = 0.8  # share of the polling interval a refresh may take
+REFRESH_BUDGET_MIN = 2  # seconds
+REFRESH_BUDGET_GRACE = 1  # seconds past the request deadline before cancelling
+
+DIAGNOSTICS_HISTORY = 10  # raw snapshots kept for the diagnostics download
+METRICS_WINDOW = 256  # samples per phase percentiles are computed over
+
+STORAGE_VERSION = 1
+STORE_SAVE_DELAY = 300  # seconds last snapshot writes are coalesced for
 
 CONF_SN = "serial_number"
+DATA_DEVICE = "device"  # detected identity cached in the config entry data
+INFO_SN = 2  # index of the serial number in the Information array
+INFO_FIRMWARE = 4  # index of the firmware version in the Information array
+DATA_SCHEDULER = "scheduler"  # hub scheduler shared by all entries
+CONF_SET_SCAN_INTERVAL = "set_scan_interval"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_WRITE_COMPARE_AGE = "write_compare_age"
+CONF_RECORD_PAYLOADS = "record_payloads"
 
 U16 = "_uint16"
 U32 = "_uint32"
 S16 = "_int16"
 S32 = "_int32"
 
+# Run states (register 0x1D / 0x106) driving the adaptive polling interval
+RUN_STATES_ACTIVE = (1, 2, 3, 13)  # Preparing, Charging, Finishing, Stoping
+RUN_STATES_IDLE = (0, 5)  # Available (unplugged), Unavailable
+
 
 # =================================== base class for sensor entity descriptions =========================================
 @dataclass
@@ -41,6 +91,14 @@ class BaseHttpSensorEntityDescription(SensorEntityDescription):
     register: int = -1  # initialize with invalid register
     rounding: int = 1
     value_function: callable = None  #  value = function(initval, descr, datadict)
+    deadband: float = 0  # state is only written when value moves by more than this
+
+
+@dataclass
+class BaseHttpDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Base class for sensors reporting the state of the integration itself."""
+
+    value_function: callable = None  #  value = function(coordinator)
 
 
 @dataclass
@@ -89,6 +147,7 @@ class BaseHttpNumberEntityDescription(NumberEntityDescription):
     blacklist: list = None  # None or list of serial number prefixes like
     initvalue: int = None  # initial default value for WRITE_DATA_LOCAL entities
     prevent_update: bool = False  # if set to True, value will not be re-read/updated with each polling cycle; only when read value changes
+    deadband: float = 0  # state is only written when value moves by more than this
 
 
 @dataclass
@@ -5,26 +5,81 @@ data updates from the SolaX HTTP API.
 """
 
 import asyncio
-from datetime import timedelta
+import contextlib
+from datetime import datetime, timedelta
+from functools import partial
 import json
 import logging
-
-import aiohttp
+from pathlib import Path
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.sensor import SensorStateClass
 from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
-    API_TIMEOUT,
+    ATTR_DATA_TIME,
+    ATTR_STALE,
+    BURST_MAX_SAMPLES,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_RECORD_PAYLOADS,
+    CONF_SET_SCAN_INTERVAL,
     CONF_SN,
+    CONF_WRITE_COMPARE_AGE,
+    DATA_DEVICE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SET_SCAN_INTERVAL,
+    DEFAULT_WRITE_COMPARE_AGE,
+    DIAGNOSTICS_HISTORY,
     DOMAIN,
+    FAST_POLL_AFTER_WRITE,
+    INFO_FIRMWARE,
+    INFO_SN,
+    OFFLINE_PROBE_INTERVAL,
+    REFRESH_BUDGET_GRACE,
+    REFRESH_BUDGET_MIN,
+    REFRESH_BUDGET_SHARE,
     REQUEST_REFRESH_DELAY,
+    RUN_STATES_ACTIVE,
+    RUN_STATES_IDLE,
+    STALE_DATA_TTL,
+    STORAGE_VERSION,
+    STORE_SAVE_DELAY,
+    WRITE_COALESCE_DELAY,
+)
+from .metrics import (
+    ENDPOINT_REALTIME,
+    ENDPOINT_SET,
+    PHASE_DECODE,
+    PHASE_FANOUT,
+    PHASE_PARSE,
+    PHASE_REFRESH,
+    PHASE_REQUEST_REALTIME,
+    PHASE_REQUEST_SET,
+    SIZE_REALTIME,
+    SIZE_SET,
+    PollMetrics,
 )
 from .plugin_base import plugin_base
+from .plugin_factory import PluginFactory
+from .payload_capture import SUFFIX, PayloadRecorder
+from .register_map import SET
+from .response import (
+    SolaXApiError,
+    SolaXDecodeError,
+    SolaXRequestFailed,
+    decode_response,
+)
+from .scheduler import SolaxHttpScheduler
+from .snapshot import RegisterArray, RingBuffer
+from .transport import BREAKER_HALF_OPEN, CircuitBreaker, SolaxHttpTransport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,7 +99,8 @@ class SolaxHttpUpdateCoordinator(DataUpdateCoordinator[None]):
         hass: HomeAssistant,
         config: ConfigEntry,
         plugin: plugin_base,
-        session: aiohttp.ClientSession
+        transport: SolaxHttpTransport,
+        scheduler: SolaxHttpScheduler = None,
     ) -> None:
         """Initialize Solax Http API data updater."""
 
@@ -52,15 +108,82 @@ class SolaxHttpUpdateCoordinator(DataUpdateCoordinator[None]):
         self._host = config.options.get(CONF_HOST, None)
         self._sn = config.options.get(CONF_SN, None)
         self.plugin = plugin
-        self.session = session
+        self.transport = transport
+        self.scheduler = scheduler
+        self._slot_time = None  # loop time of the next scheduled poll
+        self.circuit_breaker = CircuitBreaker()
+        self._set_scan_interval = config.options.get(
+            CONF_SET_SCAN_INTERVAL, DEFAULT_SET_SCAN_INTERVAL
+        )
+        self._set_data_time = None  # monotonic time of the last Set read
+        self._data_time = None  # monotonic time of the last realtime read
+        # Wall time of the last good read per endpoint and whether the last
+        # read failed, the arrays then hold the last good data
+        self._good_times = {ENDPOINT_REALTIME: None, ENDPOINT_SET: None}
+        self._stale = {ENDPOINT_REALTIME: False, ENDPOINT_SET: False}
+        self._notified_stale = None
+        self._endpoints = {
+            reg.register: ENDPOINT_SET if reg.source == SET else ENDPOINT_REALTIME
+            for reg in plugin.REGISTER_MAP
+            if reg.source is not None
+        }
+        self._realtime_seed = None  # realtime payload to use instead of a read
+        self.burst_samples = None  # RingBuffer of (timestamp, Data) of the last burst
+        self._burst = None  # interval, start and end of the last burst
+        self._burst_task = None
+        self._store = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{config.entry_id}")
+        self._store_pending = False  # a delayed save is scheduled
+        self.recorder = None
+        if config.options.get(CONF_RECORD_PAYLOADS, False):
+            self.recorder = PayloadRecorder(
+                hass, Path(hass.config.path(DOMAIN, f"{config.entry_id}{SUFFIX}"))
+            )
+        self._write_compare_age = config.options.get(
+            CONF_WRITE_COMPARE_AGE, DEFAULT_WRITE_COMPARE_AGE
+        )
+        # Snapshot arrays, refilled in place on every poll
+        self._set_array = RegisterArray()
+        self._data_array = RegisterArray()
+        self._info_array = RegisterArray()
+        # Copies of the last snapshots for the diagnostics download
+        self.history = RingBuffer(DIAGNOSTICS_HISTORY)
+        self._set_copy = None  # shared by history entries until Set is re-read
 
-        scan_interval = config.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        self._scan_interval = config.options.get(
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        )
+        self._min_scan_interval = min(
+            config.options.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+            self._scan_interval,
+        )
+        self._max_scan_interval = max(
+            config.options.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            self._scan_interval,
+        )
+        self._fast_poll_until = 0.0  # monotonic deadline of a pending change
+        self._failed_polls = 0  # consecutive polls without realtime data
+        self._identity_checked = False  # against the identity cached in the entry
+        self._reachable = None  # result of the last probe, None before any
+        self._decoded = {}  # decoded values of the current snapshot
+        self._decoded_data = None  # snapshot the decoded values belong to
+        self.decode_cache_hits = 0
+        self.decode_cache_misses = 0
+        self.metrics = PollMetrics()
+        self._decode_time = 0.0  # seconds spent in map_data during a fan-out
+        self._notified_values = {}  # value last sent to each listener
+        self._notified_success = None
+        self.state_writes_emitted = 0
+        self.state_writes_suppressed = 0
+        self._io_lock = asyncio.Lock()  # polls and writes never overlap
+        self._pending_writes = {}  # setReg index -> queued entry
+        self._pending_refresh = False
+        self._write_task = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}-{self._host}",
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=timedelta(seconds=self._scan_interval),
             request_refresh_debouncer=Debouncer(
                 hass,
                 _LOGGER,
@@ -68,130 +191,697 @@ class SolaxHttpUpdateCoordinator(DataUpdateCoordinator[None]):
                 immediate=False,
             ),
         )
+        self._verify_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REQUEST_REFRESH_DELAY,
+            immediate=False,
+            function=self._async_verify_writes,
+        )
 
     async def _async_update_data(self):
-        """Fetch data from SolaX Http Api."""
+        """Fetch data from SolaX Http Api.
+
+        The requests of a refresh share a time budget derived from the
+        polling interval, so that a charger which does not answer cannot
+        hold a refresh open past the next one. Anything still running when
+        the budget is exhausted is cancelled.
+        """
+        loop = self.hass.loop
+        start = loop.time()
+        cycle_start = start
+        if self._slot_time is not None and start >= self._slot_time:
+            self.scheduler.record_lag(self, start - self._slot_time)
+            cycle_start = self._slot_time
+            self._slot_time = None
+        interval = self.update_interval.total_seconds()
+        budget = self.refresh_budget
+        deadline = time.monotonic() + budget
 
         try:
-            # This timeout is only a safeguard against the API methods locking
-            # up. The API methods themselves have their own timeouts.
-            async with asyncio.timeout(10 * API_TIMEOUT):
+            # The requests stop retrying at the deadline, the timeout only
+            # cancels a refresh which locked up past it.
+            async with asyncio.timeout(budget + REFRESH_BUDGET_GRACE):
+                if not self.circuit_breaker.allow_request():
+                    raise UpdateFailed(
+                        f"{self._host} keeps failing, polling suspended"
+                    )
+                if self._failed_polls and not await self.transport.async_probe():
+                    # Waiting out the request timeouts would tell nothing more
+                    self._failed_polls += 1
+                    self._reachable = False
+                    if self.circuit_breaker.state == BREAKER_HALF_OPEN:
+                        self.circuit_breaker.record_failure()  # suspend again
+                    self._adjust_update_interval(self.data)
+                    raise UpdateFailed(f"{self._host} is not reachable")
+                self._reachable = True
                 # Fetch updates
-                data = await self.__async_get_data()
+                data = await self.__async_get_data(deadline)
+                if data is None:
+                    self.circuit_breaker.record_failure()
+                    self._adjust_update_interval(self.data)
+                    raise UpdateFailed(f"No realtime data from {self._host}")
+                self.circuit_breaker.record_success()
                 if self.plugin.invertertype is None:
                     await self.plugin.initialize(data)
+                self._adjust_update_interval(data)
                 return data
 
+        except TimeoutError as err:
+            self.metrics.cancelled += 1
+            self._failed_polls += 1
+            self.circuit_breaker.record_failure()
+            self._adjust_update_interval(self.data)  # back off
+            raise UpdateFailed(
+                f"Refresh cancelled after its budget of {budget:.1f} s"
+            ) from err
         except SolaXApiError as err:
             _LOGGER.exception("Fetching data failed")
             raise UpdateFailed(err) from err
+        finally:
+            end = loop.time()
+            self.metrics.observe(PHASE_REFRESH, end - start)
+            if end > cycle_start + interval:
+                self.metrics.overruns += 1
+                _LOGGER.debug(
+                    "%s: refresh took %.1f s and missed the next slot",
+                    self._host,
+                    end - start,
+                )
+
+    @property
+    def refresh_budget(self) -> float:
+        """Return seconds a refresh may take at the current interval."""
+        return max(
+            self.update_interval.total_seconds() * REFRESH_BUDGET_SHARE,
+            REFRESH_BUDGET_MIN,
+        )
+
+    def _adjust_update_interval(self, data) -> None:
+        """Adapt the polling interval to the charger state.
+
+        Poll fast while a vehicle is charging or a setting change is pending,
+        slow down while the charger is idle and back off exponentially while
+        the device does not respond. An unreachable charger is probed at a
+        short fixed interval, probes are cheap.
+        """
+        if self._reachable is False:
+            interval = OFFLINE_PROBE_INTERVAL
+        elif self._failed_polls:
+            interval = min(
+                self._scan_interval * 2 ** (self._failed_polls - 1),
+                self._max_scan_interval,
+            )
+        elif time.monotonic() < self._fast_poll_until:
+            interval = self._min_scan_interval
+        else:
+            run_state = self.plugin.get_run_state(data)
+            if run_state in RUN_STATES_ACTIVE:
+                interval = self._min_scan_interval
+            elif run_state in RUN_STATES_IDLE:
+                interval = self._max_scan_interval
+            else:
+                interval = self._scan_interval
+
+        update_interval = timedelta(seconds=interval)
+        if update_interval != self.update_interval:
+            _LOGGER.debug("%s: polling every %s s", self._host, interval)
+            self.update_interval = update_interval
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next poll in the slot given by the hub scheduler."""
+        if self.scheduler is None or self.update_interval is None:
+            super()._schedule_refresh()
+            return
+        if self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        self._slot_time = self.scheduler.next_slot(
+            self, self.update_interval.total_seconds()
+        )
+        self._unsub_refresh = self.hass.loop.call_at(
+            self._slot_time, self._handle_slot
+        ).cancel
+
+    @callback
+    def _handle_slot(self) -> None:
+        self.config_entry.async_create_background_task(
+            self.hass, self._handle_refresh_interval(), f"{self.name} poll"
+        )
+
+    @property
+    def poll_lag(self) -> float | None:
+        """Return seconds the last scheduled poll started after its slot."""
+        if self.scheduler is None:
+            return None
+        lag = self.scheduler.lag(self)
+        return None if lag is None else round(lag, 2)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose decoded value changed.
+
+        Entities register with their description as context. They are only
+        woken up when the value decoded for that description moved outside
+        the description's deadband, or when the coordinator availability
+        changed.
+        """
+        start = time.perf_counter()
+        self._decode_time = 0.0
+        # Entities re-evaluate availability and attributes when staleness changes
+        stale = tuple(
+            (self._stale[endpoint], self._expired(endpoint))
+            for endpoint in self._stale
+        )
+        notify_all = (
+            self.data is None
+            or self.last_update_success != self._notified_success
+            or stale != self._notified_stale
+        )
+        self._notified_success = self.last_update_success
+        self._notified_stale = stale
+        notified_values = {}
+        for listener, (update_callback, context) in list(self._listeners.items()):
+            if context is None or notify_all:
+                changed = True
+                value = _MISSING if context is None else self.get_data(context)
+            else:
+                value = self.get_data(context)
+                old_value = self._notified_values.get(listener, _MISSING)
+                changed = _value_changed(old_value, value, context)
+            if changed:
+                self.state_writes_emitted += 1
+                notified_values[listener] = value
+                update_callback()
+            else:
+                self.state_writes_suppressed += 1
+                notified_values[listener] = self._notified_values[listener]
+        self._notified_values = notified_values
+        elapsed = time.perf_counter() - start
+        self.metrics.observe(PHASE_DECODE, self._decode_time)
+        self.metrics.observe(PHASE_FANOUT, elapsed - self._decode_time)
 
     def get_data(self, descr):
-        """Retrieve mapped data for the given description."""
-        return self.plugin.map_data(descr, self.data)
+        """Retrieve mapped data for the given description.
 
-    async def __async_get_data(self) -> dict:
-        # Grab active context variables to limit data required to be fetched from API
-        # Note: using context is not required if there is no need or ability to limit
-        # data retrieved from API.
+        Values are decoded once per snapshot. Entities sharing a register and
+        its scaling (e.g. Charge Voltage and Charge Voltage L1) are served
+        from the same decoded value.
+        """
+        data = self.data
+        if data is not self._decoded_data:
+            self._decoded = {}
+            self._decoded_data = data
+        key = _decode_key(descr)
         try:
-            realtimeData = await self._read_realtime_data()
-            setData = await self._read_set_data()
-            if setData is None:
-                setData = []
-            if realtimeData is None:
-                realtimeData = {"Data": [], "Information": []}
-        except Exception:
-            _LOGGER.exception("Something went wrong reading from Http API")
+            value = self._decoded[key]
+        except KeyError:
+            self.decode_cache_misses += 1
+            start = time.perf_counter()
+            value = self._decoded[key] = self.plugin.map_data(descr, data)
+            self._decode_time += time.perf_counter() - start
+        else:
+            self.decode_cache_hits += 1
+        return value
+
+    def invalidate_set_data(self) -> None:
+        """Force Set data to be re-read on the next refresh."""
+        self._set_data_time = None
+
+    def _set_data_expired(self) -> bool:
+        if self._set_data_time is None:
+            return True
+        return time.monotonic() - self._set_data_time >= self._set_scan_interval
+
+    async def async_restore_snapshot(self) -> bool:
+        """Restore the last good snapshot saved before a restart."""
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        self._set_array.refill(stored.get("Set", []))
+        self._data_array.refill(stored.get("Data", []))
+        self._info_array.refill(stored.get("Info", []))
+        times = stored.get("times", {})
+        for endpoint in self._good_times:
+            self._good_times[endpoint] = times.get(endpoint)
+            self._stale[endpoint] = True  # until read again
+        self.data = self._snapshot()
+        return True
+
+    def _schedule_store(self) -> None:
+        # Store.async_delay_save re-arms its timer on every call, scheduling on
+        # every poll would postpone the save until Home Assistant stops
+        if not self._store_pending:
+            self._store_pending = True
+            self._store.async_delay_save(self._stored_snapshot, STORE_SAVE_DELAY)
+
+    def _stored_snapshot(self) -> dict:
+        self._store_pending = False
+        return {
+            "Set": list(self._set_array),
+            "Data": list(self._data_array),
+            "Info": list(self._info_array),
+            "times": dict(self._good_times),
+        }
+
+    def data_age(self, endpoint: str) -> float | None:
+        """Return seconds since the last good read of an endpoint."""
+        good_time = self._good_times[endpoint]
+        return None if good_time is None else time.time() - good_time
+
+    def _expired(self, endpoint: str) -> bool:
+        if not self._stale[endpoint]:
+            return False
+        age = self.data_age(endpoint)
+        return age is not None and age > STALE_DATA_TTL
+
+    def is_expired(self, descr) -> bool:
+        """Return True if the data of the entity is stale for too long."""
+        endpoint = self._endpoints.get(descr.register)
+        return endpoint is not None and self._expired(endpoint)
 
+    def stale_attributes(self, descr) -> dict | None:
+        """Return state attributes marking an entity backed by stale data."""
+        endpoint = self._endpoints.get(descr.register)
+        if endpoint is None or not self._stale[endpoint]:
+            return None
+        good_time = self._good_times[endpoint]
         return {
-            "Set": dict(enumerate(setData)),
-            "Data": dict(enumerate(realtimeData["Data"])),
-            "Info": dict(enumerate(realtimeData["Information"])),
+            ATTR_STALE: True,
+            ATTR_DATA_TIME: None
+            if good_time is None
+            else datetime.fromtimestamp(good_time).astimezone().isoformat(),
         }
 
-    async def _read_realtime_data(self):
-        httpData = None
-        text = await self._http_post(
-            f"http://{self._host}", f"optType=ReadRealTimeData&pwd={self._sn}"
+    def seed_realtime_data(self, realtimeData) -> None:
+        """Use an already fetched realtime payload for the next refresh."""
+        self._realtime_seed = realtimeData
+
+    def _value_current(self, descr) -> bool:
+        """Return True if the snapshot value of the register can be trusted.
+
+        Values are trusted up to the write compare age since the last read
+        of their endpoint, a value changed from the app or OCPP since then
+        must not make a write look unchanged.
+        """
+        endpoint = self._endpoints.get(descr.register)
+        if endpoint == ENDPOINT_SET:
+            read_time = self._set_data_time
+        elif endpoint == ENDPOINT_REALTIME:
+            read_time = self._data_time
+        else:
+            return False
+        return (
+            read_time is not None
+            and time.monotonic() - read_time <= self._write_compare_age
         )
-        if text is None:
+
+    def _store_set_data(self, setData) -> None:
+        if setData is None:
+            # Keep the last good array, Set is read again on the next poll
+            self._set_data_time = None
+            self._stale[ENDPOINT_SET] = True
+            return
+        self._set_copy = None
+        self._set_array.refill(setData)
+        self._set_data_time = time.monotonic()
+        self._good_times[ENDPOINT_SET] = time.time()
+        self._stale[ENDPOINT_SET] = False
+
+    def _snapshot(self) -> dict:
+        return {
+            "Set": self._set_array,
+            "Data": self._data_array,
+            "Info": self._info_array,
+        }
+
+    async def __async_get_data(self, deadline: float = None) -> dict | None:
+        # Set data rarely changes, so it is only re-read when the cached copy
+        # expires or after a write. Realtime data is read on every refresh.
+        async with self._io_lock:
+            read_set = self._set_data_expired()
+            realtimeData, self._realtime_seed = self._realtime_seed, None
+            if realtimeData is None:
+                realtimeData, setData = await self._fetch_endpoints(
+                    read_set, deadline
+                )
+            elif read_set:
+                setData = await self._read_endpoint(
+                    partial(self._read_set_data, deadline=deadline)
+                )
+            else:
+                setData = None
+        if read_set:
+            self._store_set_data(setData)
+        if realtimeData is None:
+            # The arrays are kept, they back the last published snapshot
+            self._failed_polls += 1
+            self._data_time = None
+            self._stale[ENDPOINT_REALTIME] = True
             return None
-        if "failed" in text:
-            _LOGGER.error("Failed to read data from http: %s", text)
+        self._failed_polls = 0
+        self._data_time = time.monotonic()
+        self._good_times[ENDPOINT_REALTIME] = time.time()
+        self._stale[ENDPOINT_REALTIME] = False
+
+        self._data_array.refill(realtimeData.get("Data", []))
+        self._info_array.refill(realtimeData.get("Information", []))
+        if not self._identity_checked:
+            self._check_identity()
+        self._schedule_store()
+        if self._set_copy is None:
+            self._set_copy = self._set_array.copy()
+        self.history.append(
+            (
+                time.time(),
+                self._set_copy,
+                self._data_array.copy(),
+                self._info_array.copy(),
+            )
+        )
+        return self._snapshot()
+
+    def _check_identity(self) -> None:
+        """Update the cached identity if the charger changed since it was saved.
+
+        A firmware update changes the device info, another charger at the
+        same host may need another plugin. The update listener of the entry
+        reloads it with the new identity.
+        """
+        self._identity_checked = True
+        device = self.config_entry.data.get(DATA_DEVICE)
+        sn = self._info_array.get(INFO_SN)
+        firmware = self._info_array.get(INFO_FIRMWARE)
+        if device is None or sn is None:
+            return
+        if sn == device["sn"] and firmware == device["firmware"]:
+            return
+        try:
+            plugin = PluginFactory.create_plugin(sn, firmware)
+        except ValueError:
+            _LOGGER.warning("%s: unsupported charger %s", self._host, sn)
+            return
+        _LOGGER.info(
+            "%s: charger %s firmware %s differs from the saved %s firmware %s",
+            self._host,
+            sn,
+            firmware,
+            device["sn"],
+            device["firmware"],
+        )
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **self.config_entry.data,
+                DATA_DEVICE: {
+                    **device,
+                    "sn": sn,
+                    "firmware": firmware,
+                    "invertertype": plugin.invertertype,
+                },
+            },
+        )
+
+    async def _fetch_endpoints(self, read_set=True, deadline: float = None):
+        """Read realtime and Set data back-to-back.
+
+        The charger serves one connection at a time and the transport
+        serializes its requests, so both endpoints are read one after the
+        other, the realtime read getting half of the time left until the
+        deadline. Each endpoint is read independently, so a failure of one
+        of them does not discard the result of the other.
+        """
+        if not read_set:
+            return (
+                await self._read_endpoint(
+                    partial(self._read_realtime_data, deadline=deadline)
+                ),
+                None,
+            )
+        realtimeData = await self._read_endpoint(
+            partial(self._read_realtime_data, deadline=_share(deadline, 2))
+        )
+        setData = await self._read_endpoint(
+            partial(self._read_set_data, deadline=deadline)
+        )
+        return realtimeData, setData
+
+    @property
+    def burst_active(self) -> bool:
+        """Return True while a burst is sampling."""
+        return self._burst_task is not None
+
+    @callback
+    def async_start_burst(self, interval: float, duration: float) -> None:
+        """Sample realtime data every interval seconds for duration seconds.
+
+        Samples go to an in-memory ring buffer only, entities keep updating
+        at the polling interval. A running burst is replaced.
+        """
+        self.async_stop_burst()
+        self.burst_samples = RingBuffer(
+            min(int(duration / interval) + 1, BURST_MAX_SAMPLES)
+        )
+        self._burst = {
+            "interval": interval,
+            "start": datetime.now().astimezone(),
+            "end": None,
+        }
+        self._burst_task = self.config_entry.async_create_background_task(
+            self.hass, self._async_burst(interval, duration), f"{self.name} burst"
+        )
+
+    @callback
+    def async_stop_burst(self) -> None:
+        """Stop a running burst, its samples are kept."""
+        if self._burst_task is not None:
+            self._burst_task.cancel()
+            self._burst_task = None
+
+    async def _async_burst(self, interval: float, duration: float) -> None:
+        burst = self._burst
+        loop = self.hass.loop
+        end = loop.time() + duration
+        next_sample = loop.time()
+        _LOGGER.debug("%s: burst sampling every %s s", self._host, interval)
+        try:
+            while next_sample < end:
+                async with self._io_lock:
+                    realtimeData = await self._read_endpoint(
+                        partial(self._read_realtime_data, record=False)
+                    )
+                if realtimeData is not None:
+                    data = realtimeData.get("Data", [])
+                    self.burst_samples.append((time.time(), RegisterArray(data)))
+                    # The next poll publishes the latest sample instead of reading
+                    self._realtime_seed = realtimeData
+                next_sample += interval
+                await asyncio.sleep(max(next_sample - loop.time(), 0))
+        finally:
+            burst["end"] = datetime.now().astimezone()
+            if self._burst_task is asyncio.current_task():
+                self._burst_task = None
+            _LOGGER.debug("%s: burst finished", self._host)
+
+    def burst_report(self) -> dict:
+        """Return the samples of the last burst decoded per measurement."""
+        if self._burst is None:
+            return {}
+        plugin = self.plugin
+        descriptions = [
+            descr
+            for descr in plugin.SENSOR_TYPES
+            if descr.state_class == SensorStateClass.MEASUREMENT
+            and plugin.matchWithMask(descr.allowedtypes, descr.blacklist)
+        ]
+        samples = []
+        for timestamp, data in self.burst_samples:
+            snapshot = {"Set": self._set_array, "Data": data, "Info": self._info_array}
+            sample = {"time": datetime.fromtimestamp(timestamp).astimezone().isoformat()}
+            for descr in descriptions:
+                sample[descr.key] = plugin.map_data(descr, snapshot)
+            samples.append(sample)
+        end = self._burst["end"]
+        return {
+            "interval": self._burst["interval"],
+            "start": self._burst["start"].isoformat(),
+            "end": None if end is None else end.isoformat(),
+            "active": self.burst_active,
+            "samples": samples,
+        }
+
+    async def _read_endpoint(self, reader):
+        try:
+            return await reader()
+        except Exception:
+            _LOGGER.exception("Something went wrong reading from Http API")
+        return None
+
+    async def _read_realtime_data(self, record=True, deadline: float = None):
+        start = time.perf_counter()
+        body = await self._http_post(
+            f"optType=ReadRealTimeData&pwd={self._sn}", deadline
+        )
+        if body is None:
+            self.metrics.count_failure(ENDPOINT_REALTIME)
             return None
+        self.metrics.observe(PHASE_REQUEST_REALTIME, time.perf_counter() - start)
+        self.metrics.observe(SIZE_REALTIME, len(body))
+        if record and self.recorder is not None:
+            self.recorder.record("ReadRealTimeData", body)
+        start = time.perf_counter()
         try:
-            httpData = json.loads(text)
-        except json.decoder.JSONDecodeError:
-            _LOGGER.error("Failed to decode json: %s", text)
-        return httpData
+            return decode_response(body)
+        except SolaXRequestFailed as err:
+            _LOGGER.error("Failed to read data from http: %s", err)
+        except SolaXDecodeError as err:
+            _LOGGER.error("Failed to decode json: %s", err)
+        finally:
+            self.metrics.observe(PHASE_PARSE, time.perf_counter() - start)
+        self.metrics.count_failure(ENDPOINT_REALTIME)
+        return None
 
     async def write_register(self, entity_description, value, always=False) -> None:
-        """Write register through http."""
+        """Write register through http.
+
+        Writes are queued for a short time so that changes made together
+        (e.g. by an automation or a slider) are sent in a single setReg
+        request. A later write to the same register replaces the queued one.
+        """
 
         payload = self.plugin.map_payload(entity_description, value)
         if payload is None:
             return
 
-        if not always:
-            self.data = await self.__async_get_data()
+        # A queued write to the same register is replaced, not compared: the
+        # snapshot does not show it yet (e.g. a slider dragged 16 -> 10 -> 16)
+        queued = any(entry["reg"] in self._pending_writes for entry in payload)
+        if (
+            not always
+            and not queued
+            and self.data is not None
+            and self._value_current(entity_description)
+        ):
             current_value = self.get_data(entity_description)
             if current_value == value:
                 return
 
-        resp = await self._http_post(
-            f"http://{self._host}",
-            f'optType=setReg&pwd={self._sn}&data={{"num":1,"Data":{json.dumps(payload)}}}',
-        )
+        for entry in payload:
+            self._pending_writes[entry["reg"]] = entry
+        self._pending_refresh = self._pending_refresh or not always
+        if self._write_task is None:
+            self._write_task = self.hass.async_create_task(
+                self._flush_writes(), f"{self.name} write"
+            )
+        await asyncio.shield(self._write_task)
+
+    async def _flush_writes(self) -> None:
+        """Send all queued register writes in one setReg request."""
+        await asyncio.sleep(WRITE_COALESCE_DELAY)
+        async with self._io_lock:
+            # Writes queued from now on go to the next request
+            self._write_task = None
+            entries = list(self._pending_writes.values())
+            refresh = self._pending_refresh
+            self._pending_writes = {}
+            self._pending_refresh = False
+
+            resp = await self._http_post(
+                f'optType=setReg&pwd={self._sn}&data={{"num":{len(entries)},"Data":{json.dumps(entries)}}}',
+            )
         if resp is not None:
             _LOGGER.debug("Received HTTP API response %s", resp)
 
-        if not always:
-            data = await self.__async_get_data()
-            self.async_set_updated_data(data)
+        self.invalidate_set_data()
+        self._fast_poll_until = time.monotonic() + FAST_POLL_AFTER_WRITE
+        if refresh:
+            await self._verify_debouncer.async_call()
 
-    async def _read_set_data(self):
-        setData = None
-        text = await self._http_post(
-            f"http://{self._host}", f"optType=ReadSetData&pwd={self._sn}"
-        )
-        if text is None:
+    async def _async_verify_writes(self) -> None:
+        """Re-read only Set data after a write and publish it."""
+        async with self._io_lock:
+            setData = await self._read_endpoint(self._read_set_data)
+        if setData is None:
+            return  # Set data stays invalidated, the next poll reads it
+        self._store_set_data(setData)
+        self.async_set_updated_data(self._snapshot())
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled work of the coordinator."""
+        await super().async_shutdown()
+        self._verify_debouncer.async_cancel()
+        self.async_stop_burst()
+        if self._write_task is not None:
+            # Still within the batching delay, the transport closes next
+            self._write_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._write_task
+            self._write_task = None
+            self._pending_writes = {}
+        if self.recorder is not None:
+            await self.recorder.async_close()
+
+    async def _read_set_data(self, deadline: float = None):
+        start = time.perf_counter()
+        body = await self._http_post(f"optType=ReadSetData&pwd={self._sn}", deadline)
+        if body is None:
+            self.metrics.count_failure(ENDPOINT_SET)
             _LOGGER.warning("Received empty Set data from http")
             return None
-        if "failed" in text:
-            _LOGGER.error("Failed to read Set data from http: %s", text)
-            return None
+        self.metrics.observe(PHASE_REQUEST_SET, time.perf_counter() - start)
+        self.metrics.observe(SIZE_SET, len(body))
+        if self.recorder is not None:
+            self.recorder.record("ReadSetData", body)
+        start = time.perf_counter()
         try:
-            setData = json.loads(text)
-        except json.decoder.JSONDecodeError:
-            _LOGGER.error("Failed to decode Set json: %s", text)
-        return setData
+            return decode_response(body, list)
+        except SolaXRequestFailed as err:
+            _LOGGER.error("Failed to read Set data from http: %s", err)
+        except SolaXDecodeError as err:
+            _LOGGER.error("Failed to decode Set json: %s", err)
+        finally:
+            self.metrics.observe(PHASE_PARSE, time.perf_counter() - start)
+        self.metrics.count_failure(ENDPOINT_SET)
+        return None
 
-    async def _http_post(self, url, payload, retry=3):
-        try:
-            async with self.session.post(url, data=payload) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-        except TimeoutError:
-            if retry > 0:
-                return await self._http_post(url, payload, retry - 1)
-            _LOGGER.error("Timeout error reading from Http. Url: %s", url)
-        except aiohttp.ServerDisconnectedError:
-            if retry:
-                return await self._http_post(url, payload, retry - 1)
-            _LOGGER.error("Server disconnected error reading from Http. Url: %s", url)
-        except aiohttp.client_exceptions.ClientOSError:
-            if retry > 0:
-                return await self._http_post(url, payload, retry - 1)
-            _LOGGER.error("ClientOSError reading from Http. Url: %s", url)
-        except aiohttp.ClientError as err:
-            if retry:
-                return await self._http_post(url, payload, retry - 1)
-            _LOGGER.error("ClientError reading from Http. Url: %s", url)
-        except Exception as ex:
-            _LOGGER.exception("Error reading from Http. Url: %s", url, exc_info=ex)
+    async def _http_post(self, payload, deadline: float = None):
+        return await self.transport.async_post(payload, deadline)
+
+
+_MISSING = object()
+
+
+def _share(deadline: float | None, requests: int) -> float | None:
+    """Return the deadline of the first of requests sharing the time left."""
+    if deadline is None:
         return None
+    now = time.monotonic()
+    return now + max(deadline - now, 0) / requests
+
+
+def _value_changed(old_value, value, descr) -> bool:
+    """Return True if value differs from old_value beyond the deadband."""
+    if old_value is _MISSING:
+        return True
+    deadband = getattr(descr, "deadband", 0)
+    if (
+        deadband
+        and isinstance(value, (int, float))
+        and isinstance(old_value, (int, float))
+    ):
+        return abs(value - old_value) > deadband
+    return value != old_value
 
 
-class SolaXApiError(Exception):
-    """Base exception for all SolaX API errors."""
+def _decode_key(descr):
+    """Return a key identifying how a description decodes its register."""
+    scale = getattr(descr, "scale", None)
+    if scale is not None and not isinstance(scale, (int, float)):
+        scale = id(scale)  # dicts and callables are shared by reference
+    return (
+        descr.register,
+        getattr(descr, "unit", None),
+        scale,
+        getattr(descr, "rounding", None),
+    )
@@ -0,0 +1,120 @@
+"""Diagnostics support for the SolaX HTTP integration.
+
+Everything is assembled when the diagnostics are downloaded. While polling,
+the coordinator only keeps copies of the last raw arrays in a RingBuffer and
+the timing windows of its PollMetrics.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_SN, DATA_DEVICE, DOMAIN, INFO_SN
+from .coordinator import SolaxHttpUpdateCoordinator
+from .entity_definitions import INVERTERTYPE_FLAGS
+from .metrics import (
+    ENDPOINT_REALTIME,
+    ENDPOINT_SET,
+    PHASE_REQUEST_REALTIME,
+    PHASE_REQUEST_SET,
+)
+from .register_map import INFO
+
+TO_REDACT = {CONF_SN, "sn", "serial_number"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SolaxHttpUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    plugin = coordinator.plugin
+    return {
+        "options": async_redact_data(entry.options, TO_REDACT),
+        "device": async_redact_data(entry.data.get(DATA_DEVICE, {}), TO_REDACT),
+        "plugin": {
+            "name": plugin.plugin_name,
+            "invertertype": plugin.invertertype,
+            "flags": _decode_flags(plugin.invertertype),
+        },
+        "transport": coordinator.transport.stats,
+        "circuit_breaker": {
+            "state": coordinator.circuit_breaker.state,
+            "failures": coordinator.circuit_breaker.failures,
+            "trips": coordinator.circuit_breaker.trips,
+        },
+        "scheduler": coordinator.scheduler.stats,
+        "data_age": {
+            endpoint: coordinator.data_age(endpoint)
+            for endpoint in (ENDPOINT_REALTIME, ENDPOINT_SET)
+        },
+        "decode_cache": {
+            "hits": coordinator.decode_cache_hits,
+            "misses": coordinator.decode_cache_misses,
+        },
+        "state_writes": {
+            "emitted": coordinator.state_writes_emitted,
+            "suppressed": coordinator.state_writes_suppressed,
+        },
+        "timing": coordinator.metrics.as_dict(),
+        "latency_history_ms": {
+            "realtime": coordinator.metrics.history_ms(PHASE_REQUEST_REALTIME),
+            "set": coordinator.metrics.history_ms(PHASE_REQUEST_SET),
+        },
+        "entities": _entity_values(coordinator),
+        "history": [
+            {
+                "time": datetime.fromtimestamp(timestamp).astimezone().isoformat(),
+                "Set": list(set_data),
+                "Data": list(data),
+                "Info": [
+                    REDACTED if index == INFO_SN else value
+                    for index, value in enumerate(info)
+                ],
+            }
+            for timestamp, set_data, data, info in coordinator.history
+        ],
+        "burst": coordinator.burst_report(),
+    }
+
+
+def _decode_flags(invertertype) -> list[str]:
+    if not invertertype:
+        return []
+    return [name for name, flag in INVERTERTYPE_FLAGS.items() if invertertype & flag]
+
+
+def _entity_values(coordinator: SolaxHttpUpdateCoordinator) -> list[dict]:
+    """Return the decoded value of every entity next to its source."""
+    plugin = coordinator.plugin
+    definitions = {reg.register: reg for reg in plugin.REGISTER_MAP}
+    data = coordinator.data
+    entities = []
+    for descriptions in (
+        plugin.SENSOR_TYPES,
+        plugin.NUMBER_TYPES,
+        plugin.SELECT_TYPES,
+        plugin.TIME_TYPES,
+    ):
+        for descr in descriptions:
+            if not plugin.matchWithMask(descr.allowedtypes, descr.blacklist):
+                continue
+            reg = definitions.get(descr.register)
+            entity = {
+                "key": descr.key,
+                "register": f"0x{descr.register:X}",
+                "source": None if reg is None else reg.source,
+                "index": None if reg is None else reg.index,
+            }
+            if data is not None and reg is not None and reg.source is not None:
+                indices = reg.index if isinstance(reg.index, tuple) else (reg.index,)
+                if reg.source == INFO and INFO_SN in indices:
+                    entity["raw"] = entity["value"] = REDACTED
+                else:
+                    entity["raw"] = [data[reg.source].get(i) for i in indices]
+                    entity["value"] = coordinator.get_data(descr)
+            entities.append(entity)
+    return entities
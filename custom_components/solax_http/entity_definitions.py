@@ -19,6 +19,7 @@ from .const import (
     U16,
     U32,
     BaseHttpButtonEntityDescription,
+    BaseHttpDiagnosticSensorEntityDescription,
     BaseHttpNumberEntityDescription,
     BaseHttpSelectEntityDescription,
     BaseHttpSensorEntityDescription,
@@ -53,6 +54,17 @@ G2 = V20
 
 ALLDEFAULT = 0
 
+INVERTERTYPE_FLAGS = {
+    "POW7": POW7,
+    "POW11": POW11,
+    "POW22": POW22,
+    "X1": X1,
+    "X3": X3,
+    "V10": V10,
+    "V11": V11,
+    "V20": V20,
+}
+
 # ======================= end of bitmask handling code =============================================
 
 
@@ -894,3 +906,91 @@ SENSOR_TYPES: list[SolaXEVChargerHttpSensorEntityDescription] = [
         allowedtypes=G1,
     ),
 ]
+
+# ================================= Diagnostic Sensor Declarations =================================================
+
+DIAGNOSTIC_SENSOR_TYPES: list[BaseHttpDiagnosticSensorEntityDescription] = [
+    BaseHttpDiagnosticSensorEntityDescription(
+        name="Connection state",
+        key="circuit_breaker",
+        device_class=SensorDeviceClass.ENUM,
+        options=["closed", "open", "half_open"],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:lan-disconnect",
+        value_function=lambda coordinator: coordinator.circuit_breaker.state,
+    ),
+    BaseHttpDiagnosticSensorEntityDescription(
+        name="Poll lag",
+        key="poll_lag",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:timer-sand",
+        value_function=lambda coordinator: coordinator.poll_lag,
+    ),
+    *(
+        BaseHttpDiagnosticSensorEntityDescription(
+            name=f"{phase_name} p{percent}",
+            key=f"{phase}_p{percent}",
+            native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            icon="mdi:timer-outline",
+            value_function=lambda coordinator, phase=phase, percent=percent: (
+                coordinator.metrics.percentile_ms(phase, percent)
+            ),
+        )
+        for phase, phase_name in (
+            ("request_realtime", "Realtime request"),
+            ("request_set", "Settings request"),
+            ("parse", "Parse"),
+            ("decode", "Decode"),
+            ("fanout", "Fan-out"),
+            ("refresh", "Refresh"),
+        )
+        for percent in (50, 95)
+    ),
+    *(
+        BaseHttpDiagnosticSensorEntityDescription(
+            name=f"{endpoint_name} request failures",
+            key=f"{endpoint}_failures",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            icon="mdi:alert-circle-outline",
+            value_function=lambda coordinator, endpoint=endpoint: (
+                coordinator.metrics.failures[endpoint]
+            ),
+        )
+        for endpoint, endpoint_name in (("realtime", "Realtime"), ("set", "Settings"))
+    ),
+    BaseHttpDiagnosticSensorEntityDescription(
+        name="Poll overruns",
+        key="poll_overruns",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:timer-alert-outline",
+        value_function=lambda coordinator: coordinator.metrics.overruns,
+    ),
+    *(
+        BaseHttpDiagnosticSensorEntityDescription(
+            name=f"{endpoint_name} data age",
+            key=f"{endpoint}_data_age",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_registry_enabled_default=False,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            icon="mdi:clock-alert-outline",
+            value_function=lambda coordinator, endpoint=endpoint: (
+                coordinator.data_age(endpoint)
+            ),
+        )
+        for endpoint, endpoint_name in (("realtime", "Realtime"), ("set", "Settings"))
+    ),
+]
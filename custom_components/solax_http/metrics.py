@@ -0,0 +1,130 @@
+"""Module provides the timing metrics of the SolaX HTTP coordinator.
+
+Every poll is split into phases: the request to each endpoint, parsing the
+JSON response, decoding the registers and fanning the values out to the
+entities. The whole refresh is timed as well. Each phase keeps its last
+samples in a fixed-size window from which percentiles are computed on
+demand.
+"""
+
+from array import array
+import math
+
+from .const import METRICS_WINDOW
+
+PHASE_REQUEST_REALTIME = "request_realtime"
+PHASE_REQUEST_SET = "request_set"
+PHASE_PARSE = "parse"
+PHASE_DECODE = "decode"
+PHASE_FANOUT = "fanout"
+PHASE_REFRESH = "refresh"
+SIZE_REALTIME = "size_realtime"
+SIZE_SET = "size_set"
+
+ENDPOINT_REALTIME = "realtime"
+ENDPOINT_SET = "set"
+
+
+class RollingWindow:
+    """Last samples of a measurement, with percentiles over them."""
+
+    __slots__ = ("_values", "_next", "_count", "total")
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Initialize an empty window."""
+        self._values = array("d", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+        self.total = 0  # samples observed since start
+
+    def observe(self, value: float) -> None:
+        """Add a sample, replacing the oldest one when full."""
+        values = self._values
+        values[self._next] = value
+        self._next = (self._next + 1) % len(values)
+        if self._count < len(values):
+            self._count += 1
+        self.total += 1
+
+    def history(self) -> list[float]:
+        """Return the samples of the window, oldest first."""
+        values = self._values
+        start = self._next - self._count
+        return [values[i % len(values)] for i in range(start, self._next)]
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the window."""
+        if not self._count:
+            return None
+        return _nearest_rank(sorted(self._values[: self._count]), percent)
+
+    def summary(self, scale: float = 1) -> dict:
+        """Return count, p50, p95 and max of the window."""
+        if not self._count:
+            return {"count": self.total}
+        ordered = sorted(self._values[: self._count])
+        return {
+            "count": self.total,
+            "p50": round(_nearest_rank(ordered, 50) * scale, 3),
+            "p95": round(_nearest_rank(ordered, 95) * scale, 3),
+            "max": round(ordered[-1] * scale, 3),
+        }
+
+
+def _nearest_rank(ordered, percent: float) -> float:
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class PollMetrics:
+    """Timing of the poll phases and failure counts per endpoint.
+
+    A refresh overruns when it ends after the slot of the next one and is
+    cancelled when it exceeds its time budget.
+    """
+
+    TIMES = (
+        PHASE_REQUEST_REALTIME,
+        PHASE_REQUEST_SET,
+        PHASE_PARSE,
+        PHASE_DECODE,
+        PHASE_FANOUT,
+        PHASE_REFRESH,
+    )
+    SIZES = (SIZE_REALTIME, SIZE_SET)
+
+    def __init__(self) -> None:
+        """Initialize empty windows for all phases."""
+        self.windows = {name: RollingWindow() for name in self.TIMES + self.SIZES}
+        self.failures = {ENDPOINT_REALTIME: 0, ENDPOINT_SET: 0}
+        self.overruns = 0
+        self.cancelled = 0
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a sample of a phase (seconds) or size (bytes)."""
+        self.windows[name].observe(value)
+
+    def count_failure(self, endpoint: str) -> None:
+        """Count a failed request."""
+        self.failures[endpoint] += 1
+
+    def percentile_ms(self, phase: str, percent: float) -> float | None:
+        """Return a percentile of a phase in milliseconds."""
+        value = self.windows[phase].percentile(percent)
+        return None if value is None else round(value * 1000, 2)
+
+    def history_ms(self, phase: str) -> list[float]:
+        """Return the samples of a phase in milliseconds, oldest first."""
+        return [round(value * 1000, 2) for value in self.windows[phase].history()]
+
+    def as_dict(self) -> dict:
+        """Return all phases (ms), sizes (bytes), failure and overrun counts."""
+        return {
+            "times_ms": {
+                name: self.windows[name].summary(1000) for name in self.TIMES
+            },
+            "sizes_bytes": {name: self.windows[name].summary() for name in self.SIZES},
+            "failures": dict(self.failures),
+            "overruns": self.overruns,
+            "cancelled": self.cancelled,
+        }
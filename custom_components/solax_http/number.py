@@ -50,6 +50,8 @@ class SolaXHttpNumber(CoordinatorEntity, NumberEntity):
     async def async_added_to_hass(self) -> None:
         """Register callbacks."""
         await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._value = self.coordinator.get_data(self.entity_description)
 
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
@@ -70,6 +72,18 @@ class SolaXHttpNumber(CoordinatorEntity, NumberEntity):
     def unique_id(self) -> Optional[str]:
         return f"{self._platform_name}_{self.entity_description.key}"
 
+    @property
+    def available(self) -> bool:
+        """Return False once the data behind the entity is stale for too long."""
+        return super().available and not self.coordinator.is_expired(
+            self.entity_description
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Mark a value kept from the last good read of a failed endpoint."""
+        return self.coordinator.stale_attributes(self.entity_description)
+
     @property
     def native_value(self) -> float:
         return self._value
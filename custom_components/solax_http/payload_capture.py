@@ -0,0 +1,213 @@
+"""Module provides recording and replay of raw SolaX HTTP API responses.
+
+The recorder appends every ReadRealTimeData and ReadSetData response with
+its timestamp to a gzip compressed JSONL file, one JSON object per line::
+
+    {"ts": 1718000000.123, "endpoint": "ReadRealTimeData", "body": "{...}"}
+
+Files are rotated by size like a RotatingFileHandler, ``<name>.jsonl.gz``
+being the newest and ``<name>.<n>.jsonl.gz`` older ones. Lines are buffered
+and written in the executor, never on the event loop.
+
+The replay transport reads such files and serves the recorded responses to
+the coordinator in their original order, at original or accelerated speed.
+"""
+
+import asyncio
+from collections import deque
+import contextlib
+import gzip
+import json
+import logging
+from pathlib import Path
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import RECORDER_BACKUPS, RECORDER_FLUSH_DELAY, RECORDER_MAX_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+SUFFIX = ".jsonl.gz"
+
+
+def recording_files(path: Path) -> list[Path]:
+    """Return the files of a recording, oldest first."""
+    base = str(path)[: -len(SUFFIX)]
+    backups = []
+    for backup in path.parent.glob(f"{Path(base).name}.*{SUFFIX}"):
+        number = backup.name[len(Path(base).name) + 1 : -len(SUFFIX)]
+        if number.isdigit():
+            backups.append((int(number), backup))
+    files = [backup for _, backup in sorted(backups, reverse=True)]
+    if path.exists():
+        files.append(path)
+    return files
+
+
+class PayloadRecorder:
+    """Append raw API responses to a rotating compressed JSONL file."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: Path,
+        max_bytes: int = RECORDER_MAX_BYTES,
+        backups: int = RECORDER_BACKUPS,
+    ) -> None:
+        """Initialize the recorder, nothing is written before the first record."""
+        self.hass = hass
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.records = 0
+        self._pending = []
+        self._flush_task = None
+
+    @callback
+    def record(self, endpoint: str, body: bytes) -> None:
+        """Queue a response, it is written with the next batch."""
+        self._pending.append(
+            json.dumps(
+                {
+                    "ts": time.time(),
+                    "endpoint": endpoint,
+                    "body": body.decode("utf-8", "replace"),
+                }
+            )
+        )
+        self.records += 1
+        if self._flush_task is None:
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush(), f"{self.path.name} recorder"
+            )
+
+    async def _async_flush(self) -> None:
+        try:
+            # Batch the lines, every write appends a gzip member
+            await asyncio.sleep(RECORDER_FLUSH_DELAY)
+            await self._async_write_pending()
+        finally:
+            self._flush_task = None
+
+    async def _async_write_pending(self) -> None:
+        while self._pending:
+            lines, self._pending = self._pending, []
+            await self.hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[str]) -> None:
+        """Append lines to the file, rotating it first when full."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+                self._rotate()
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+        except OSError:
+            _LOGGER.exception("Failed to write recording %s", self.path)
+
+    def _rotate(self) -> None:
+        base = str(self.path)[: -len(SUFFIX)]
+        for number in range(self.backups - 1, 0, -1):
+            source = Path(f"{base}.{number}{SUFFIX}")
+            if source.exists():
+                source.replace(f"{base}.{number + 1}{SUFFIX}")
+        if self.backups:
+            self.path.replace(f"{base}.1{SUFFIX}")
+        else:
+            self.path.unlink()
+
+    async def async_close(self) -> None:
+        """Write all queued responses."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        await self._async_write_pending()
+
+
+class ReplayTransport:
+    """Transport serving recorded responses instead of a charger.
+
+    Every endpoint is served its own recorded responses in order. With
+    speed 1 a response is not returned before its original time relative
+    to the first record, speed 10 replays ten times faster and speed 0
+    as fast as the coordinator asks. Writes are accepted and dropped.
+    """
+
+    def __init__(self, path: Path, speed: float = 1.0, repeat: bool = False) -> None:
+        """Initialize the transport, async_load() reads the recording."""
+        self.host = f"replay:{path.name}"
+        self.path = path
+        self.speed = speed
+        self.repeat = repeat
+        self._records = {}  # endpoint -> deque of (ts, body)
+        self._all = {}
+        self._first_ts = None
+        self._start = None
+        self.requests = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return replay statistics."""
+        return {
+            "requests": self.requests,
+            "remaining": {key: len(value) for key, value in self._records.items()},
+        }
+
+    def _read(self) -> dict:
+        records = {}
+        for file in recording_files(self.path):
+            with gzip.open(file, "rt", encoding="utf-8") as lines:
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    records.setdefault(record["endpoint"], []).append(
+                        (record["ts"], record["body"])
+                    )
+        return records
+
+    async def async_load(self) -> None:
+        """Read the recording in a worker thread."""
+        self._all = await asyncio.to_thread(self._read)
+        self._records = {key: deque(value) for key, value in self._all.items()}
+        first = [value[0][0] for value in self._all.values() if value]
+        self._first_ts = min(first) if first else None
+
+    async def async_post(self, payload: str, deadline: float = None):
+        """Return the next recorded response for the requested endpoint.
+
+        The deadline is ignored, responses keep their recorded pacing.
+        """
+        self.requests += 1
+        endpoint = next(
+            (
+                part[len("optType=") :]
+                for part in payload.split("&")
+                if part.startswith("optType=")
+            ),
+            None,
+        )
+        records = self._records.get(endpoint)
+        if not records:
+            if not self.repeat or not self._all.get(endpoint):
+                return None
+            records = self._records[endpoint] = deque(self._all[endpoint])
+        ts, body = records.popleft()
+        body = body.encode()
+        if self.speed > 0:
+            now = time.monotonic()
+            if self._start is None:
+                self._start = now
+            due = self._start + (ts - self._first_ts) / self.speed
+            if due > now:
+                await asyncio.sleep(due - now)
+        return body
+
+    async def async_probe(self, timeout: float = None) -> bool:
+        """A recording is always reachable."""
+        return True
+
+    async def async_close(self) -> None:
+        """Nothing to close."""
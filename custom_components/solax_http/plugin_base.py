@@ -1,8 +1,9 @@
 """Module provides the base plugin class for Solax HTTP integration."""
 
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+from typing import ClassVar
 
 from homeassistant.components.button import ButtonEntityDescription
 from homeassistant.components.number import NumberEntityDescription
@@ -11,10 +12,22 @@ from homeassistant.components.sensor import SensorEntityDescription
 from homeassistant.components.time import TimeEntityDescription
 from homeassistant.helpers.device_registry import DeviceInfo
 
+from .const import U16, BaseHttpSensorEntityDescription
 from .entity_definitions import ALL_POW_GROUP, ALL_VER_GROUP, ALL_X_GROUP
+from .register_map import CompiledRegisterMap, RegisterDef, compile_register_map
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw (unscaled) run state registers, newest first
+RUN_STATE_DESCRIPTIONS = (
+    BaseHttpSensorEntityDescription(
+        key="run_state", register=0x1D, unit=U16, scale=None
+    ),
+    BaseHttpSensorEntityDescription(
+        key="charging_status", register=0x106, unit=U16, scale=None
+    ),
+)
+
 
 @dataclass
 class plugin_base:
@@ -31,6 +44,12 @@ class plugin_base:
     serialnumber: str = ""
     hw_version: str = "Unknown"
     sw_version: str = "Unknown"
+    register_map: CompiledRegisterMap = field(default=None, repr=False)
+
+    REGISTER_MAP: ClassVar[tuple[RegisterDef, ...]] = ()
+
+    def __post_init__(self) -> None:
+        self.register_map = compile_register_map(self.REGISTER_MAP)
 
     async def initialize(self) -> None:
         pass
@@ -40,26 +59,50 @@ class plugin_base:
         return "Unknown"
 
     def map_data(self, descr, data) -> any:
-        return None
+        """Map data from the snapshot based on the descriptor's register value."""
+        reader = self.register_map.readers.get(descr.register)
+        if reader is None:
+            return None
+        return_value = reader(data)
+        if return_value is None:
+            return None
+        return self._apply_scale(descr, return_value)
+
+    def map_payload(self, descr, value):
+        """Map the value to the setReg payload of the descriptor's register."""
+        target = self.register_map.writers.get(descr.register)
+        if target is None:
+            return None
+        reg, encode = target
+        payload = encode(self._reverse_scale(descr, value))
+        if payload is None:
+            return None
+        return [{"reg": reg, "val": f"{payload}"}]
 
-    def map_payload(self, address, payload):
+    def get_run_state(self, data) -> int | None:
+        """Return the raw charger run state code, or None if not available."""
+        for descr in RUN_STATE_DESCRIPTIONS:
+            value = self.map_data(descr, data)
+            if value is not None:
+                return value
         return None
 
     def _reverse_scale(self, descr, scaled_value):
         """Reverse the scaling process to retrieve the original value."""
-        if descr.scale is None:
+        scale = getattr(descr, "scale", None)  # buttons have no scale
+        if scale is None:
             return scaled_value
 
         original_value = scaled_value
-        if isinstance(descr.scale, dict):  # translate string back to int
+        if isinstance(scale, dict):  # translate string back to int
             original_value = next(
-                (key for key, val in descr.scale.items() if val == scaled_value), None
+                (key for key, val in scale.items() if val == scaled_value), None
             )
-        elif callable(descr.scale):  # reverse function call ???
+        elif callable(scale):  # reverse function call ???
             original_value = scaled_value
-        elif isinstance(descr.scale, (int, float)):  # check if scale is a number
+        elif isinstance(scale, (int, float)):  # check if scale is a number
             with suppress(Exception):
-                original_value = round(scaled_value / descr.scale)
+                original_value = round(scaled_value / scale)
         return original_value
 
     def _apply_scale(self, descr, value):
@@ -1,10 +1,8 @@
 """Module contains the PluginFactory class which is used to create instances of plugins."""
 
-import json
 import logging
 
-import aiohttp
-
+from .const import INFO_FIRMWARE, INFO_SN
 from .entity_definitions import (
     BUTTON_TYPES,
     NUMBER_TYPES,
@@ -22,6 +20,8 @@ from .entity_definitions import (
 )
 from .plugin_solax_ev_charger import solax_ev_charger_plugin
 from .plugin_solax_ev_charger_g2 import solax_ev_charger_plugin_g2
+from .response import SolaXDecodeError, SolaXRequestFailed, decode_response
+from .transport import SolaxHttpTransport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,48 +30,22 @@ class PluginFactory:
     """Factory class to create plugin instances."""
 
     @staticmethod
-    async def _http_post(url, payload, retry=3):
+    async def _read_device_info(transport: SolaxHttpTransport, pwd: str):
+        body = await transport.async_post(f"optType=ReadRealTimeData&pwd={pwd}")
+        if body is None:
+            return None
         try:
-            connector = aiohttp.TCPConnector(
-                force_close=True,
-            )
-            async with (
-                aiohttp.ClientSession(connector=connector) as session,
-                session.post(url, data=payload) as resp,
-            ):
-                if resp.status == 200:
-                    return await resp.text()
-        except TimeoutError:
-            if retry > 0:
-                return await PluginFactory._http_post(url, payload, retry - 1)
-        except aiohttp.ServerDisconnectedError:
-            if retry:
-                return await PluginFactory._http_post(url, payload, retry - 1)
-        except aiohttp.client_exceptions.ClientOSError:
-            if retry > 0:
-                return await PluginFactory._http_post(url, payload, retry - 1)
-        except Exception as ex:
-            _LOGGER.exception("Error reading from Http. Url: %s", url, exc_info=ex)
-        return None
-
-    @staticmethod
-    async def _read_device_info(host: str, pwd: str):
-        httpData = None
-        text = await PluginFactory._http_post(
-            f"http://{host}", f"optType=ReadRealTimeData&pwd={pwd}"
-        )
-        if text is None:
+            httpData = decode_response(body)
+        except SolaXRequestFailed as err:
+            _LOGGER.error("Failed to read data from http: %s", err)
             return None
-        if "failed" in text:
-            _LOGGER.error("Failed to read data from http: %s", text)
+        except SolaXDecodeError as err:
+            _LOGGER.error("Failed to decode json: %s", err)
             return None
-        try:
-            httpData = json.loads(text)
-        except json.decoder.JSONDecodeError:
-            _LOGGER.error("Failed to decode json: %s", text)
         return {
-            "sn": httpData["Information"][2],
-            "firmware": httpData["Information"][4],
+            "sn": httpData["Information"][INFO_SN],
+            "firmware": httpData["Information"][INFO_FIRMWARE],
+            "realtime": httpData,
         }
 
     @staticmethod
@@ -119,15 +93,29 @@ class PluginFactory:
         return invertertype
 
     @staticmethod
-    async def get_plugin_instance(host: str, pwd: str):
-        """Get an instance of plugin based on serial number/type."""
-        info = await PluginFactory._read_device_info(host, pwd)
-        sn = info["sn"]
+    async def get_plugin_instance(transport: SolaxHttpTransport, pwd: str):
+        """Get an instance of plugin based on serial number/type.
+
+        Returns the plugin together with the ReadRealTimeData payload read
+        for the detection, so that it can seed the first coordinator refresh.
+        """
+        info = await PluginFactory._read_device_info(transport, pwd)
+        sn = info["sn"] if info is not None else None
         if sn is None:
             _LOGGER.warning("Attempt to read serialnumber failed")
-            return None
+            return None, None
         _LOGGER.info("Read serial number: %s", sn)
-        invertertype = PluginFactory._determine_type(sn)
+        return PluginFactory.create_plugin(sn, info["firmware"]), info["realtime"]
+
+    @staticmethod
+    def create_plugin(sn: str, firmware: str, invertertype: int = None):
+        """Create the plugin matching the serial number.
+
+        invertertype is derived from the serial number unless it is given,
+        e.g. from the identity cached in the config entry.
+        """
+        if invertertype is None:
+            invertertype = PluginFactory._determine_type(sn)
         if invertertype:
             if invertertype & V10 or invertertype & V11:
                 return solax_ev_charger_plugin(
@@ -139,7 +127,7 @@ class PluginFactory:
                     NUMBER_TYPES=NUMBER_TYPES,
                     BUTTON_TYPES=BUTTON_TYPES,
                     SELECT_TYPES=SELECT_TYPES,
-                    sw_version=info["firmware"],
+                    sw_version=firmware,
                 )
             if invertertype & V20:
                 return solax_ev_charger_plugin_g2(
@@ -151,6 +139,6 @@ class PluginFactory:
                     NUMBER_TYPES=NUMBER_TYPES,
                     BUTTON_TYPES=BUTTON_TYPES,
                     SELECT_TYPES=SELECT_TYPES,
-                    sw_version=info["firmware"],
+                    sw_version=firmware,
                 )
         raise ValueError(f"Unknown inverter type: {sn}")
@@ -0,0 +1,172 @@
+"""Module provides the data-driven register map for SolaX HTTP plugins.
+
+The HTTP API does not expose Modbus registers directly. Each value lives at
+an index of the ``Set``, ``Data`` or ``Information`` array of the API
+response. Plugins declare where every Modbus-style register lives in a table
+of RegisterDef entries, which is compiled once into constant-time accessors
+for reading and into a register -> setReg index for writing.
+"""
+
+from dataclasses import dataclass
+import datetime
+import logging
+
+from .const import S16, U16, U32
+
+_LOGGER = logging.getLogger(__name__)
+
+# Source arrays of the snapshot held by the coordinator
+SET = "Set"
+DATA = "Data"
+INFO = "Info"
+
+# Codecs for values which are not plain integers
+CODEC_TIME = "time"  # hour << 8 | minute
+CODEC_DATETIME = "datetime"  # three words: year|month, day|hour, minute|second
+CODEC_VERSION = "version"  # 203 -> "2.03"
+
+
+@dataclass(frozen=True)
+class RegisterDef:
+    """Location of a register in the HTTP API arrays."""
+
+    register: int
+    source: str = None  # SET, DATA or INFO; None for write-only registers
+    index: int | tuple = None  # tuple of indices, most significant word first
+    unit: str = U16  # U16, S16 or U32
+    codec: str = None
+    offset: int = 0  # added to the decoded value
+    set_reg: int = None  # index used by setReg, None for read-only registers
+
+
+@dataclass(frozen=True)
+class CompiledRegisterMap:
+    """Register accessors compiled from a table of RegisterDef entries."""
+
+    readers: dict
+    writers: dict
+
+
+def compile_register_map(table) -> CompiledRegisterMap:
+    """Compile a register table into read accessors and write targets."""
+    readers = {}
+    writers = {}
+    for reg in table:
+        if reg.source is not None:
+            if reg.register in readers:
+                _LOGGER.warning("Duplicate register 0x%X in map", reg.register)
+            readers[reg.register] = _compile_reader(reg)
+        if reg.set_reg is not None:
+            writers[reg.register] = (reg.set_reg, _compile_writer(reg))
+    return CompiledRegisterMap(readers=readers, writers=writers)
+
+
+def _compile_reader(reg: RegisterDef):
+    source = reg.source
+    offset = reg.offset
+
+    if reg.codec == CODEC_DATETIME:
+        ym_idx, dh_idx, ms_idx = reg.index
+
+        def read(data):
+            arr = data[source]
+            ym = arr.get(ym_idx)
+            dh = arr.get(dh_idx)
+            ms = arr.get(ms_idx)
+            if ym is None or dh is None or ms is None or ym & 0x00FF == 0:
+                return None
+            try:
+                return datetime.datetime(
+                    2000 + (ym >> 8),
+                    ym & 0x00FF,
+                    dh >> 8,
+                    dh & 0x00FF,
+                    ms >> 8,
+                    ms & 0x00FF,
+                ).astimezone()
+            except ValueError:
+                return None
+
+        return read
+
+    if reg.codec == CODEC_TIME:
+        idx = reg.index
+
+        def read(data):
+            val = data[source].get(idx)
+            if val is None:
+                return None
+            hour = val >> 8
+            minute = val & 0x00FF
+            if 0 <= hour < 24 and 0 <= minute < 60:
+                return datetime.time(hour, minute)
+            return None
+
+        return read
+
+    if reg.codec == CODEC_VERSION:
+        idx = reg.index
+
+        def read(data):
+            ver = data[source].get(idx)
+            if ver is None:
+                return None
+            ver = str(ver)
+            return f"{ver[0]}.{ver[1:]}"
+
+        return read
+
+    if reg.unit == U32:
+        hi_idx, lo_idx = reg.index
+
+        def read(data):
+            arr = data[source]
+            hi = arr.get(hi_idx)
+            lo = arr.get(lo_idx)
+            if hi is None or lo is None:
+                return None
+            return hi * 65536 + lo + offset
+
+        return read
+
+    idx = reg.index
+    if reg.unit == S16:
+
+        def read(data):
+            val = data[source].get(idx)
+            if val is None:
+                return None
+            if val >= 32768:
+                val -= 65536
+            return val + offset
+
+        return read
+
+    if offset:
+
+        def read(data):
+            val = data[source].get(idx)
+            return None if val is None else val + offset
+
+        return read
+
+    def read(data):
+        return data[source].get(idx)
+
+    return read
+
+
+def _compile_writer(reg: RegisterDef):
+    if reg.codec == CODEC_TIME:
+
+        def encode(value):
+            if isinstance(value, datetime.time):
+                return (value.hour << 8) + value.minute
+            return None
+
+        return encode
+
+    def encode(value):
+        return value
+
+    return encode
@@ -0,0 +1,66 @@
+"""Module provides decoding of the SolaX HTTP API responses.
+
+The charger answers a request either with a JSON document or, when it
+rejects the request (e.g. a wrong password), with a short plain text
+containing "failed". A JSON document always starts with ``{`` or ``[``, so
+the marker is only looked for in bodies which do not, instead of scanning
+every response. Bodies are decoded from bytes with orjson when it is
+installed and with the standard library otherwise.
+
+Failures are raised as subclasses of SolaXApiError, telling a rejected
+request from a garbled response.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+FAILED_MARKER = b"failed"
+MARKER_SPAN = 64  # bytes of a non-JSON body searched for the marker
+
+_loads = json.loads if orjson is None else orjson.loads
+_WHITESPACE = b" \t\r\n"
+
+
+class SolaXApiError(Exception):
+    """Base exception for all SolaX API errors."""
+
+
+class SolaXRequestFailed(SolaXApiError):
+    """The charger rejected the request."""
+
+
+class SolaXDecodeError(SolaXApiError):
+    """The response is not the expected JSON document."""
+
+
+def decode_response(body: bytes, expected: type = dict):
+    """Decode a response body into the expected JSON type.
+
+    Raises SolaXRequestFailed when the charger answered with the failure
+    marker and SolaXDecodeError when the body is not JSON of that type.
+    """
+    head = body[:1]
+    if head and head in _WHITESPACE:
+        body = body.lstrip(_WHITESPACE)
+        head = body[:1]
+    if head != b"{" and head != b"[":
+        if FAILED_MARKER in body[:MARKER_SPAN].lower():
+            raise SolaXRequestFailed(_excerpt(body))
+        raise SolaXDecodeError(f"Not a JSON response: {_excerpt(body)}")
+    try:
+        value = _loads(body)
+    except ValueError as err:
+        raise SolaXDecodeError(f"Invalid JSON ({err}): {_excerpt(body)}") from err
+    if not isinstance(value, expected):
+        raise SolaXDecodeError(
+            f"Expected {expected.__name__}, got {type(value).__name__}"
+        )
+    return value
+
+
+def _excerpt(body: bytes) -> str:
+    return body[:MARKER_SPAN].decode("utf-8", "replace")
@@ -0,0 +1,101 @@
+"""Module provides the hub scheduler shared by all SolaX HTTP chargers.
+
+Every coordinator would otherwise poll on its own timer, and Home Assistant
+aligns those timers to the same second, so a site with many chargers sends
+all requests at once. The scheduler places the polls of all chargers on one
+staggered timeline, serves all of them from one shared TransportPool and
+keeps track of how late every poll started compared to its slot.
+"""
+
+import logging
+import math
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import MAX_CONCURRENT_REQUESTS
+from .transport import TransportPool
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SolaxHttpScheduler:
+    """Staggered poll timeline for all chargers of the integration.
+
+    Each charger gets a phase, spread evenly over the chargers in the order
+    they were set up. A charger polling every T seconds is due at
+    ``origin + (phase + k) * T``, so chargers with the same interval are
+    T / N seconds apart.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, limit: int = MAX_CONCURRENT_REQUESTS
+    ) -> None:
+        """Initialize the scheduler with an empty timeline."""
+        self.hass = hass
+        self.pool = TransportPool(limit)
+        self._origin = hass.loop.time()
+        self._coordinators = []  # set up order defines the phase
+        self._lags = {}  # coordinator -> [last lag, max lag, polls]
+
+    @callback
+    def async_register(self, coordinator) -> None:
+        """Add a charger to the timeline."""
+        self._coordinators.append(coordinator)
+        self._lags[coordinator] = [None, 0.0, 0]
+
+    async def async_unregister(self, coordinator) -> None:
+        """Remove a charger, the pool is closed with the last one."""
+        if coordinator in self._coordinators:
+            self._coordinators.remove(coordinator)
+            del self._lags[coordinator]
+        if not self._coordinators:
+            await self.pool.async_close()
+
+    @property
+    def idle(self) -> bool:
+        """Return True if no charger is registered."""
+        return not self._coordinators
+
+    def _phase(self, coordinator) -> float:
+        return self._coordinators.index(coordinator) / len(self._coordinators)
+
+    def next_slot(self, coordinator, interval: float) -> float:
+        """Return the loop time of the next poll of a charger.
+
+        The slot is the first one of the charger at least half an interval
+        away, so a poll that ran late does not cause a double poll and a
+        changed interval is picked up at the next slot of the new grid.
+        """
+        offset = self._origin + self._phase(coordinator) * interval
+        earliest = self.hass.loop.time() + interval / 2
+        return offset + math.ceil((earliest - offset) / interval) * interval
+
+    def record_lag(self, coordinator, lag: float) -> None:
+        """Record how late a poll started compared to its slot."""
+        lags = self._lags.get(coordinator)
+        if lags is None:
+            return
+        lags[0] = lag
+        lags[1] = max(lags[1], lag)
+        lags[2] += 1
+
+    def lag(self, coordinator) -> float | None:
+        """Return the lag of the last scheduled poll of a charger."""
+        lags = self._lags.get(coordinator)
+        return None if lags is None else lags[0]
+
+    @property
+    def stats(self) -> dict:
+        """Return the timeline and lag of every charger."""
+        return {
+            "limit": self.pool.limit,
+            "chargers": {
+                coordinator.name: {
+                    "phase": round(self._phase(coordinator), 3),
+                    "last_lag": None if last is None else round(last, 3),
+                    "max_lag": round(max_lag, 3),
+                    "polls": polls,
+                }
+                for coordinator, (last, max_lag, polls) in self._lags.items()
+            },
+        }
@@ -51,6 +51,8 @@ class SolaXHttpSelect(CoordinatorEntity, SelectEntity):
     async def async_added_to_hass(self):
         """Register callbacks."""
         await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._value = self.coordinator.get_data(self.entity_description)
 
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
@@ -62,6 +64,18 @@ class SolaXHttpSelect(CoordinatorEntity, SelectEntity):
             self._value = self.coordinator.get_data(self.entity_description)
             self.async_write_ha_state()
 
+    @property
+    def available(self) -> bool:
+        """Return False once the data behind the entity is stale for too long."""
+        return super().available and not self.coordinator.is_expired(
+            self.entity_description
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Mark a value kept from the last good read of a failed endpoint."""
+        return self.coordinator.stale_attributes(self.entity_description)
+
     @property
     def current_option(self) -> str:
         return self._value
@@ -11,7 +11,11 @@ from dataclasses import dataclass, replace
 import homeassistant.util.dt as dt_util
 
 from .const import ATTR_MANUFACTURER, DOMAIN
-from .const import BaseHttpSensorEntityDescription
+from .const import (
+    BaseHttpDiagnosticSensorEntityDescription,
+    BaseHttpSensorEntityDescription,
+)
+from .entity_definitions import DIAGNOSTIC_SENSOR_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +40,13 @@ async def async_setup_entry(hass: HomeAssistant, entry, async_add_entities):
             )
             entities.append(sensor)
 
+    for diagnostic_description in DIAGNOSTIC_SENSOR_TYPES:
+        entities.append(
+            SolaXHttpDiagnosticSensor(
+                coordinator, name, plugin.device_info, diagnostic_description
+            )
+        )
+
     async_add_entities(entities)
 
     return True
@@ -61,6 +72,8 @@ class SolaXHttpSensor(CoordinatorEntity, SensorEntity):
     async def async_added_to_hass(self):
         """Register callbacks."""
         await super().async_added_to_hass()
+        if self.coordinator.data is not None:
+            self._value = self.coordinator.get_data(self.entity_description)
 
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
@@ -81,7 +94,57 @@ class SolaXHttpSensor(CoordinatorEntity, SensorEntity):
     def unique_id(self) -> Optional[str]:
         return f"{self._platform_name}_{self.entity_description.key}"
 
+    @property
+    def available(self) -> bool:
+        """Return False once the data behind the entity is stale for too long."""
+        return super().available and not self.coordinator.is_expired(
+            self.entity_description
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Mark a value kept from the last good read of a failed endpoint."""
+        return self.coordinator.stale_attributes(self.entity_description)
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
         return self._value
+
+
+class SolaXHttpDiagnosticSensor(CoordinatorEntity, SensorEntity):
+    """Representation of a sensor reporting the state of the connection."""
+
+    def __init__(
+        self,
+        coordinator,
+        platform_name,
+        device_info,
+        description: BaseHttpDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._platform_name = platform_name
+        self._attr_device_info = device_info
+        self.entity_description: BaseHttpDiagnosticSensorEntityDescription = (
+            description
+        )
+
+    @property
+    def available(self) -> bool:
+        """Diagnostics stay available while the charger is not."""
+        return True
+
+    @property
+    def name(self):
+        """Return the name."""
+        return f"{self._platform_name} {self.entity_description.name}"
+
+    @property
+    def unique_id(self) -> Optional[str]:
+        return f"{self._platform_name}_{self.entity_description.key}"
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self.entity_description.value_function(self.coordinator)
@@ -0,0 +1,88 @@
+"""Services of the SolaX HTTP integration."""
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    BURST_DEFAULT_DURATION,
+    BURST_DEFAULT_INTERVAL,
+    BURST_MAX_DURATION,
+    BURST_MAX_INTERVAL,
+    BURST_MIN_INTERVAL,
+    DOMAIN,
+)
+from .coordinator import SolaxHttpUpdateCoordinator
+
+SERVICE_START_BURST = "start_burst"
+SERVICE_STOP_BURST = "stop_burst"
+SERVICE_GET_BURST = "get_burst"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_INTERVAL = "interval"
+ATTR_DURATION = "duration"
+
+ENTRY_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+START_BURST_SCHEMA = ENTRY_SCHEMA.extend(
+    {
+        vol.Optional(ATTR_INTERVAL, default=BURST_DEFAULT_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=BURST_MIN_INTERVAL, max=BURST_MAX_INTERVAL)
+        ),
+        vol.Optional(ATTR_DURATION, default=BURST_DEFAULT_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=BURST_MAX_DURATION)
+        ),
+    }
+)
+
+
+def _get_coordinator(hass: HomeAssistant, call: ServiceCall):
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    if not isinstance(coordinator, SolaxHttpUpdateCoordinator):
+        raise ServiceValidationError(f"No loaded SolaX HTTP charger {entry_id}")
+    return coordinator
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    @callback
+    def start_burst(call: ServiceCall) -> None:
+        """Sample one charger at a high rate for a limited time."""
+        _get_coordinator(hass, call).async_start_burst(
+            call.data[ATTR_INTERVAL], call.data[ATTR_DURATION]
+        )
+
+    @callback
+    def stop_burst(call: ServiceCall) -> None:
+        """Stop the burst of a charger before its end."""
+        _get_coordinator(hass, call).async_stop_burst()
+
+    @callback
+    def get_burst(call: ServiceCall) -> ServiceResponse:
+        """Return the samples of the last burst of a charger."""
+        return _get_coordinator(hass, call).burst_report()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_BURST, start_burst, schema=START_BURST_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_BURST, stop_burst, schema=ENTRY_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_BURST,
+        get_burst,
+        schema=ENTRY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
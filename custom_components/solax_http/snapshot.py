@@ -0,0 +1,107 @@
+"""Module provides compact containers for the arrays returned by the HTTP API.
+
+The plugins read values with ``.get(index)``. RegisterArray keeps that
+contract without building a dict per array and poll: numeric arrays are held
+in an ``array('l')`` which is refilled in place when the next response has
+the same length, anything else is kept as a tuple.
+
+RingBuffer keeps the last samples in a list allocated once.
+"""
+
+from array import array
+
+
+class RegisterArray:
+    """Read-only, bounds-checked view of one API array."""
+
+    __slots__ = ("_values", "_len")
+
+    def __init__(self, values=()) -> None:
+        """Initialize the array with the given values."""
+        self._values = _pack(values)
+        self._len = len(self._values)
+
+    def get(self, index, default=None):
+        """Return the value at index, or default when out of range."""
+        if 0 <= index < self._len:
+            return self._values[index]
+        return default
+
+    def refill(self, values) -> "RegisterArray":
+        """Replace the content, reusing the buffer when possible."""
+        buffer = self._values
+        if isinstance(buffer, array) and len(values) == self._len:
+            try:
+                for i, value in enumerate(values):
+                    buffer[i] = value
+            except (TypeError, OverflowError):
+                pass
+            else:
+                return self
+        self._values = _pack(values)
+        self._len = len(self._values)
+        return self
+
+    def copy(self) -> "RegisterArray":
+        """Return a copy which is not touched by later refills."""
+        values = self._values
+        return RegisterArray(values[:] if isinstance(values, array) else values)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __repr__(self) -> str:
+        return f"RegisterArray({list(self._values)!r})"
+
+
+class RingBuffer:
+    """Fixed-size buffer keeping the most recent items."""
+
+    __slots__ = ("_items", "_next", "_count")
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty buffer holding up to size items."""
+        self._items = [None] * size
+        self._next = 0
+        self._count = 0
+
+    @property
+    def size(self) -> int:
+        """Return the capacity of the buffer."""
+        return len(self._items)
+
+    def append(self, item) -> None:
+        """Add an item, overwriting the oldest one when full."""
+        items = self._items
+        items[self._next] = item
+        self._next = (self._next + 1) % len(items)
+        if self._count < len(items):
+            self._count += 1
+
+    def clear(self) -> None:
+        """Drop all items."""
+        self._items = [None] * len(self._items)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        """Iterate from the oldest to the newest item."""
+        items = self._items
+        start = self._next - self._count
+        for i in range(start, self._next):
+            yield items[i % len(items)]
+
+
+def _pack(values):
+    if isinstance(values, (array, tuple)):
+        return values
+    try:
+        return array("l", values)
+    except (TypeError, OverflowError):
+        return tuple(values)
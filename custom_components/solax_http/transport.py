@@ -0,0 +1,359 @@
+"""Module provides the HTTP transport for the SolaX HTTP integration.
+
+It contains the per-charger transport shared by the plugin factory and the
+coordinator, the connection pool shared by the transports of all chargers,
+the retry policy used for every request and the circuit breaker which stops
+polling a charger that keeps failing.
+"""
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import logging
+import random
+import time
+
+import aiohttp
+
+from .const import (
+    API_TIMEOUT,
+    CIRCUIT_BREAKER_PROBE_INTERVAL,
+    CIRCUIT_BREAKER_THRESHOLD,
+    KEEPALIVE_TIMEOUT,
+    MAX_CONCURRENT_REQUESTS,
+    OFFLINE_PROBE_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+KEEPALIVE_MAX_DISCONNECTS = 2  # dropped reused connections before keep-alive is off
+
+_CLOSE = {"Connection": "close"}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy with exponential backoff, jitter and a total deadline."""
+
+    attempts: int = 3  # total number of attempts
+    base_delay: float = 0.5  # delay before the first retry
+    max_delay: float = 4.0
+    jitter: float = 0.5  # +/- fraction applied to every delay
+    deadline: float = 2 * API_TIMEOUT  # seconds for all attempts together
+    attempt_timeout: float = API_TIMEOUT
+
+    def delay(self, retry: int) -> float:
+        """Return the delay before the given retry (0 based)."""
+        delay = min(self.base_delay * 2**retry, self.max_delay)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class CircuitBreaker:
+    """Stop talking to a charger after repeated failures.
+
+    After ``threshold`` consecutive failures the breaker opens and requests
+    are refused. Once ``probe_interval`` has passed a single probe request
+    is allowed (half open); its result closes or re-opens the breaker.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        probe_interval: float = CIRCUIT_BREAKER_PROBE_INTERVAL,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state != BREAKER_OPEN:
+            return True
+        if time.monotonic() - self.opened_at >= self.probe_interval:
+            self.state = BREAKER_HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        if self.state != BREAKER_CLOSED:
+            _LOGGER.info("Device responds again, closing circuit breaker")
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure and open the breaker when over the threshold."""
+        self.failures += 1
+        if self.state == BREAKER_HALF_OPEN or (
+            self.state == BREAKER_CLOSED and self.failures >= self.threshold
+        ):
+            if self.state == BREAKER_CLOSED:
+                self.trips += 1
+                _LOGGER.warning(
+                    "Device failed %d times, polling suspended for %s s",
+                    self.failures,
+                    self.probe_interval,
+                )
+            self.state = BREAKER_OPEN
+            self.opened_at = time.monotonic()
+
+
+def _create_session(limit: int) -> aiohttp.ClientSession:
+    """Create a session with at most one connection per charger."""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_created)
+    trace_config.on_connection_reuseconn.append(_on_connection_reused)
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=1,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector, trace_configs=[trace_config])
+
+
+async def _on_connection_created(session, context, params) -> None:
+    context.trace_request_ctx.connections_created += 1
+
+
+async def _on_connection_reused(session, context, params) -> None:
+    context.trace_request_ctx.connections_reused += 1
+
+
+class TransportPool:
+    """Connection pool shared by the transports of all chargers.
+
+    One session serves every charger, still with at most one connection per
+    charger. The limiter caps the number of requests in flight over all
+    chargers; time spent waiting for it does not count against the request
+    timeout.
+    """
+
+    def __init__(self, limit: int = MAX_CONCURRENT_REQUESTS) -> None:
+        """Initialize the pool, the session is created on first use."""
+        self.limit = limit
+        self.limiter = asyncio.Semaphore(limit)
+        self._session = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared session."""
+        if self._session is None:
+            self._session = _create_session(self.limit)
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the shared session and its connections."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+
+class SolaxHttpTransport:
+    """HTTP transport to a single charger.
+
+    The embedded web server of the charger handles one connection at a
+    time, so the transport uses a connector limited to one connection per
+    charger, either its own or the one of a shared TransportPool. Requests
+    to the charger are serialized by the transport before they take a slot
+    of the pool, so a request waiting for the connection of its charger
+    neither holds a slot nor has the wait counted against its timeout.
+    The connection is kept alive while the charger honours keep-alive and
+    the transport asks for the connection to be closed after every request
+    otherwise. aiohttp enables TCP_NODELAY on every client connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        pool: TransportPool = None,
+    ) -> None:
+        """Initialize the transport, the session is created on first use."""
+        self.host = host
+        self.url = f"http://{host}"
+        self.policy = policy
+        self.pool = pool
+        self.keep_alive = None  # None until detected from the first response
+        self._session = None
+        self._lock = asyncio.Lock()  # one request to the charger at a time
+        self._disconnects = 0  # disconnects of reused connections
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.queue_time = 0.0  # seconds spent waiting for the charger and pool
+        self.probes = 0
+        self.probe_failures = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return request and connection reuse statistics."""
+        return {
+            "keep_alive": self.keep_alive,
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+            "queue_time": round(self.queue_time, 3),
+            "probes": self.probes,
+            "probe_failures": self.probe_failures,
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.pool is not None:
+            return self.pool.session
+        if self._session is None:
+            self._session = _create_session(1)
+        return self._session
+
+    async def _disable_keep_alive(self, reason: str) -> None:
+        _LOGGER.info("%s: %s, using a new connection per request", self.host, reason)
+        self.keep_alive = False
+        # Drop the idle connection, the shared pool drops it on release
+        await self.async_close()
+
+    def _check_keep_alive(self, resp: aiohttp.ClientResponse) -> bool:
+        """Return False if the response shows keep-alive is not honoured."""
+        return resp.version >= aiohttp.HttpVersion11 and (
+            resp.headers.get("Connection", "").lower() != "close"
+        )
+
+    async def async_close(self) -> None:
+        """Close the own session and its connection, a shared pool stays open."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    @contextlib.asynccontextmanager
+    async def _slot(self):
+        """Wait for the charger, then for the shared pool limiter, if any."""
+        start = time.monotonic()
+        async with self._lock:
+            if self.pool is None:
+                self.queue_time += time.monotonic() - start
+                yield
+                return
+            async with self.pool.limiter:
+                self.queue_time += time.monotonic() - start
+                yield
+
+    async def async_probe(self, timeout: float = OFFLINE_PROBE_TIMEOUT) -> bool:
+        """Return True if the charger answers a bare request within timeout.
+
+        A single short request without retries is much cheaper than a poll
+        which has to wait out its full timeout on every retry, so it is used
+        to tell an unreachable charger before polling it. Any HTTP answer
+        counts. The probe goes through the connector like every request, so
+        the charger still sees one connection at a time, and asks for that
+        connection to be closed.
+        """
+        self.probes += 1
+        try:
+            async with self._slot():
+                async with self._get_session().get(
+                    self.url,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    headers=_CLOSE,
+                    trace_request_ctx=self,
+                ):
+                    pass
+        except (TimeoutError, aiohttp.ClientError) as err:
+            self.probe_failures += 1
+            _LOGGER.debug("%s is not reachable: %r", self.host, err)
+            return False
+        return True
+
+    async def async_post(self, payload: str, deadline: float = None):
+        """Post payload to the charger and return the response body or None.
+
+        Failed attempts are retried according to the retry policy. No retry
+        is started when it could not finish before the policy deadline or
+        the given deadline (time.monotonic()), whichever comes first.
+        """
+        policy = self.policy
+        if deadline is None:
+            deadline = time.monotonic() + policy.deadline
+        else:
+            deadline = min(deadline, time.monotonic() + policy.deadline)
+        error = None
+        self.requests += 1
+        for attempt in range(policy.attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            reused = self.connections_reused
+            try:
+                async with self._slot():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError  # deadline passed while queued
+                    timeout = aiohttp.ClientTimeout(
+                        total=min(policy.attempt_timeout, remaining)
+                    )
+                    async with self._get_session().post(
+                        self.url,
+                        data=payload,
+                        timeout=timeout,
+                        headers=None if self.keep_alive is not False else _CLOSE,
+                        trace_request_ctx=self,
+                    ) as resp:
+                        if resp.status != 200:
+                            _LOGGER.debug(
+                                "Http status %s from %s", resp.status, self.url
+                            )
+                            self.failures += 1
+                            return None
+                        body = await resp.read()
+                        honoured = self._check_keep_alive(resp)
+                if self.keep_alive is None:
+                    if honoured:
+                        self.keep_alive = True
+                    else:
+                        await self._disable_keep_alive("keep-alive not supported")
+                return body
+            except TimeoutError:
+                error = "Timeout error"
+            except aiohttp.ServerDisconnectedError:
+                error = "Server disconnected error"
+                if self.keep_alive and self.connections_reused != reused:
+                    # The charger dropped an idle connection we tried to reuse
+                    self._disconnects += 1
+                    if self._disconnects >= KEEPALIVE_MAX_DISCONNECTS:
+                        await self._disable_keep_alive("idle connections dropped")
+            except aiohttp.ClientOSError:
+                error = "ClientOSError"
+            except aiohttp.ClientError:
+                error = "ClientError"
+            except Exception as ex:
+                _LOGGER.exception(
+                    "Error reading from Http. Url: %s", self.url, exc_info=ex
+                )
+                self.failures += 1
+                return None
+
+            if attempt + 1 < policy.attempts:
+                delay = policy.delay(attempt)
+                if time.monotonic() + delay >= deadline:
+                    break
+                self.retries += 1
+                await asyncio.sleep(delay)
+
+        self.failures += 1
+        _LOGGER.error(
+            "%s reading from Http. Url: %s", error or "Deadline exceeded", self.url
+        )
+        return None
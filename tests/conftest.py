@@ -0,0 +1,28 @@
+"""Fixtures of the tests."""
+
+import asyncio
+from pathlib import Path
+import sys
+import tempfile
+
+import pytest
+
+TESTS = Path(__file__).resolve().parent
+sys.path.insert(0, str(TESTS.parent))
+sys.path.insert(0, str(TESTS.parent / "benchmarks"))  # simulator
+
+
+@pytest.fixture
+def loop_hass():
+    """Return an event loop and a Home Assistant instance running on it."""
+    from homeassistant.core import HomeAssistant
+
+    async def create(config_dir):
+        return HomeAssistant(config_dir)
+
+    loop = asyncio.new_event_loop()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = loop.run_until_complete(create(config_dir))
+        yield loop, hass
+        loop.run_until_complete(hass.async_stop(force=True))
+    loop.close()
@@ -0,0 +1,157 @@
+"""Tests of the SolaX HTTP coordinator against a simulated charger."""
+
+import asyncio
+import json
+import types
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.solax_http.const import (
+    CONF_SN,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WRITE_COMPARE_AGE,
+    STORE_SAVE_DELAY,
+)
+from custom_components.solax_http.coordinator import SolaxHttpUpdateCoordinator
+from custom_components.solax_http.metrics import ENDPOINT_REALTIME, ENDPOINT_SET
+from custom_components.solax_http.plugin_factory import PluginFactory
+from simulator import SimulatedCharger, serial_number
+
+SN = serial_number("G2", 1)
+
+
+class SimulatedTransport:
+    """Transport answering from a simulated charger."""
+
+    def __init__(self, charger: SimulatedCharger) -> None:
+        """Initialize the transport."""
+        self.charger = charger
+        self.writes = []
+        self.stats = {}
+
+    async def async_post(self, payload: str, deadline: float = None) -> bytes:
+        """Answer the request like the charger."""
+        if "ReadSetData" in payload:
+            return json.dumps(self.charger.read_set()).encode()
+        if "setReg" in payload:
+            self.writes.append(payload)
+            return b""
+        return json.dumps(self.charger.read_realtime()).encode()
+
+    async def async_probe(self, timeout: float = None) -> bool:
+        """The simulated charger is always reachable."""
+        return True
+
+    async def async_close(self) -> None:
+        """Nothing to close."""
+
+
+def create_coordinator(hass) -> SolaxHttpUpdateCoordinator:
+    """Return a coordinator polling a simulated charger."""
+    entry = types.SimpleNamespace(
+        entry_id="test",
+        data={},
+        options={CONF_SN: SN, "scan_interval": DEFAULT_SCAN_INTERVAL},
+        pref_disable_polling=True,
+    )
+    coordinator = SolaxHttpUpdateCoordinator(
+        hass,
+        entry,
+        PluginFactory.create_plugin(SN, "2.03"),
+        SimulatedTransport(SimulatedCharger(SN)),
+    )
+    coordinator.config_entry = entry
+    return coordinator
+
+
+@pytest.fixture
+def coordinator(loop_hass):
+    """Return a coordinator which has polled once."""
+    loop, hass = loop_hass
+    coordinator = create_coordinator(hass)
+    loop.run_until_complete(coordinator.async_refresh())
+    assert coordinator.last_update_success
+    yield coordinator
+    loop.run_until_complete(coordinator.async_shutdown())
+
+
+def set_number(coordinator):
+    """Return a number entity description backed by Set data."""
+    plugin = coordinator.plugin
+    return next(
+        descr
+        for descr in plugin.NUMBER_TYPES
+        if plugin.matchWithMask(descr.allowedtypes, descr.blacklist)
+        and coordinator._endpoints.get(descr.register) == ENDPOINT_SET
+    )
+
+
+def test_unchanged_write_skipped(loop_hass, coordinator):
+    """Writing the value just read sends nothing."""
+    loop, _ = loop_hass
+    descr = set_number(coordinator)
+    value = coordinator.get_data(descr)
+    loop.run_until_complete(coordinator.write_register(descr, value))
+    assert coordinator.transport.writes == []
+
+
+def test_unchanged_write_sent_when_stale(loop_hass, coordinator):
+    """Writing the value of an old Set read is sent, it may have changed since."""
+    loop, _ = loop_hass
+    descr = set_number(coordinator)
+    value = coordinator.get_data(descr)
+    # Read longer ago than the write compare age, still within the Set interval
+    coordinator._set_data_time -= DEFAULT_WRITE_COMPARE_AGE + 1
+    assert not coordinator._set_data_expired()
+    loop.run_until_complete(coordinator.write_register(descr, value))
+    assert len(coordinator.transport.writes) == 1
+
+
+def test_queued_write_dropped_on_shutdown(loop_hass):
+    """A write still queued when the coordinator shuts down is not sent."""
+    loop, hass = loop_hass
+    coordinator = create_coordinator(hass)
+    loop.run_until_complete(coordinator.async_refresh())
+    descr = set_number(coordinator)
+
+    async def write_and_shutdown():
+        write = hass.async_create_task(
+            coordinator.write_register(descr, coordinator.get_data(descr), True)
+        )
+        await asyncio.sleep(0)  # queued, waiting for the batching delay
+        await coordinator.async_shutdown()
+        with pytest.raises(asyncio.CancelledError):
+            await write
+
+    loop.run_until_complete(write_and_shutdown())
+    assert coordinator.transport.writes == []
+
+
+def test_snapshot_saved_and_restored(loop_hass):
+    """A poll schedules one save whose snapshot restores after a restart."""
+    loop, hass = loop_hass
+    coordinator = create_coordinator(hass)
+    with patch(
+        "homeassistant.helpers.storage.Store.async_delay_save"
+    ) as delay_save:
+        loop.run_until_complete(coordinator.async_refresh())
+        loop.run_until_complete(coordinator.async_refresh())
+        delay_save.assert_called_once()
+        data_func, delay = delay_save.call_args.args
+        assert delay == STORE_SAVE_DELAY
+        stored = data_func()
+        # Saved, the next poll schedules again
+        loop.run_until_complete(coordinator.async_refresh())
+        assert delay_save.call_count == 2
+    loop.run_until_complete(coordinator._store.async_save(stored))
+    loop.run_until_complete(coordinator.async_shutdown())
+
+    restored = create_coordinator(hass)
+    assert loop.run_until_complete(restored.async_restore_snapshot())
+    assert list(restored.data["Set"]) == stored["Set"]
+    assert list(restored.data["Data"]) == stored["Data"]
+    assert list(restored.data["Info"]) == stored["Info"]
+    for endpoint in (ENDPOINT_REALTIME, ENDPOINT_SET):
+        assert restored.data_age(endpoint) is not None
+        assert restored._stale[endpoint]